@@ -30,6 +30,14 @@ from components.navigation import render_sidebar
 from config.theme import get_custom_css
 from pages import capture, event_management, reports, settings_page
 
+# --- Page router (page name → render function) ---
+PAGE_MAP = {
+    "Captura":        capture.render,
+    "Gestión":        event_management.render,
+    "Reportes":       reports.render,
+    "Configuración":  settings_page.render,
+}
+
 
 def main() -> None:
     """Application entry point."""
@@ -44,13 +52,6 @@ def main() -> None:
     selected_page = render_sidebar()
 
     # --- Page router ---
-    PAGE_MAP = {
-        "Captura":        capture.render,
-        "Gestión":        event_management.render,
-        "Reportes":       reports.render,
-        "Configuración":  settings_page.render,
-    }
-
     page_fn = PAGE_MAP.get(selected_page)
     if page_fn:
         page_fn()
@@ -8,10 +8,10 @@ and Azure AD user directory queries.
 ============================================================================
 """
 
-from auth.microsoft import MicrosoftAuth, require_auth, get_current_user
+from auth.microsoft import MicrosoftAuth, require_auth, get_current_user, get_user_photo
 from auth.graph_users import fetch_domain_users, render_user_select
 
 __all__ = [
-    "MicrosoftAuth", "require_auth", "get_current_user",
+    "MicrosoftAuth", "require_auth", "get_current_user", "get_user_photo",
     "fetch_domain_users", "render_user_select",
 ]
@@ -30,14 +30,28 @@ from __future__ import annotations
 
 from typing import Any
 
-import requests
+import msal
 import streamlit as st
 
+from auth.microsoft import _get_auth
 from config.settings import get_settings
+from utils.http import GRAPH_TIMEOUT, get_session, parse_json
 
 
 GRAPH_USERS_ENDPOINT = "https://graph.microsoft.com/v1.0/users"
 
+# Graph's $top ceiling for /users is 999; pickers rarely need more than a
+# few hundred entries, so default lower and let callers opt in to more.
+GRAPH_MAX_PAGE_SIZE = 999
+DEFAULT_MAX_RESULTS = 200
+
+# Hard cap on the pages the basic (client-side domain) mode reads, so it
+# never scans a whole large tenant: at most 5 x 999 users per call.
+BASIC_QUERY_MAX_PAGES = 5
+
+# Minimal fields read by render_user_select (and its callers' user dicts).
+_PICKER_FIELDS: tuple[str, ...] = ("id", "displayName", "mail", "userPrincipalName")
+
 
 # ======================================================================
 # Data Fetching
@@ -45,34 +59,45 @@ GRAPH_USERS_ENDPOINT = "https://graph.microsoft.com/v1.0/users"
 
 def _get_access_token() -> str | None:
     """
-    Retrieve the current user's access token from session_state.
-    Returns None if not authenticated.
+    Retrieve the current user's access token, preferring MSAL's session
+    token cache (which refreshes expired tokens) over the raw token stored
+    in session_state at login. Returns None if not authenticated.
     """
-    token = st.session_state.get("token")
+    token = _get_auth().acquire_token_silent() or st.session_state.get("token")
     if token and "access_token" in token:
         return token["access_token"]
     return None
 
 
+@st.cache_resource(show_spinner=False)
+def _get_msal_app() -> msal.ConfidentialClientApplication:
+    """Cached MSAL confidential client for app-level directory queries."""
+    s = get_settings()
+    return msal.ConfidentialClientApplication(
+        client_id=s.azure_client_id,
+        client_credential=s.azure_client_secret,
+        authority=s.azure_authority,
+    )
+
+
 def _get_client_token() -> str | None:
     """
     Acquire an application-level token using client credentials.
     This does NOT require a logged-in user but needs User.Read.All
     application permission with admin consent.
+
+    The MSAL app is cached, so its in-memory token cache serves repeated
+    calls until the token expires instead of hitting the token endpoint.
     """
-    import msal
     settings = get_settings()
     if not settings.azure_client_id or not settings.azure_client_secret:
         return None
 
-    app = msal.ConfidentialClientApplication(
-        client_id=settings.azure_client_id,
-        client_credential=settings.azure_client_secret,
-        authority=settings.azure_authority,
-    )
-    result = app.acquire_token_for_client(
-        scopes=["https://graph.microsoft.com/.default"],
-    )
+    app = _get_msal_app()
+    scopes = settings.graph_app_scopes
+    result = app.acquire_token_silent(scopes=scopes, account=None)
+    if not result:
+        result = app.acquire_token_for_client(scopes=scopes)
     if "access_token" in result:
         return result["access_token"]
     return None
@@ -82,7 +107,8 @@ def fetch_domain_users(
     domain: str = "",
     use_client_credentials: bool = True,
     select_fields: list[str] | None = None,
-    max_results: int = 999,
+    max_results: int = DEFAULT_MAX_RESULTS,
+    domain_server_filter: bool = True,
 ) -> list[dict[str, Any]]:
     """
     Fetch users from Azure AD, optionally filtered by email domain.
@@ -94,6 +120,13 @@ def fetch_domain_users(
                 needed). If False, uses the logged-in user's token.
         select_fields: Graph API $select fields. Defaults to common fields.
         max_results: Maximum number of users to return.
+        domain_server_filter: If True, filter the domain in Graph with
+                endsWith(), which forces an advanced (non-indexed) query.
+                If False, run a basic indexed query and match the domain
+                client-side — faster when most users share the domain.
+                Basic mode reads up to ``BASIC_QUERY_MAX_PAGES`` pages
+                before sorting by displayName and keeping the first
+                ``max_results``; beyond that cap the result is partial.
 
     Returns:
         List of user dicts with keys like displayName, mail, id, jobTitle, etc.
@@ -115,45 +148,76 @@ def fetch_domain_users(
             "jobTitle", "department", "officeLocation",
         ]
 
+    # Basic mode only applies to a domain search with domain_server_filter
+    # off: the domain is matched and the results sorted client-side. Every
+    # other call keeps the server-side $orderby and stops at max_results.
+    client_filter = bool(domain) and not domain_server_filter
+    client_domain = f"@{domain.lower()}" if client_filter else ""
+    if client_filter:
+        select_fields = list(dict.fromkeys([*select_fields, "mail", "userPrincipalName"]))
+
+    # Without a server-side $orderby the first pages are in arbitrary order,
+    # so the basic mode reads full-size pages (up to BASIC_QUERY_MAX_PAGES)
+    # and only sorts and truncates at the end.
     params: dict[str, Any] = {
         "$select": ",".join(select_fields),
-        "$top": min(max_results, 999),
-        "$orderby": "displayName",
+        "$top": GRAPH_MAX_PAGE_SIZE if client_filter else min(max_results, GRAPH_MAX_PAGE_SIZE),
+    }
+
+    headers: dict[str, str] = {
+        "Authorization": f"Bearer {token}",
     }
 
     # Filter by domain — only real user accounts (exclude rooms, resources,
     # distribution lists, shared mailboxes, etc.)
     person_filter = "userType eq 'Member' and accountEnabled eq true"
-    if domain:
-        domain_filter = (
-            f"endsWith(mail, '@{domain}') or "
-            f"endsWith(userPrincipalName, '@{domain}')"
-        )
-        params["$filter"] = f"({domain_filter}) and {person_filter}"
-        # endsWith requires $count and ConsistencyLevel header
-        params["$count"] = "true"
-    else:
+    if client_filter:
         params["$filter"] = person_filter
-
-    headers: dict[str, str] = {
-        "Authorization": f"Bearer {token}",
-        "ConsistencyLevel": "eventual",
-    }
+    else:
+        params["$orderby"] = "displayName"
+        headers["ConsistencyLevel"] = "eventual"
+        if domain:
+            domain_filter = (
+                f"endsWith(mail, '@{domain}') or "
+                f"endsWith(userPrincipalName, '@{domain}')"
+            )
+            params["$filter"] = f"({domain_filter}) and {person_filter}"
+            # endsWith requires $count and ConsistencyLevel header
+            params["$count"] = "true"
+        else:
+            params["$filter"] = person_filter
 
     all_users: list[dict[str, Any]] = []
 
+    session = get_session()
+
     try:
         url: str | None = GRAPH_USERS_ENDPOINT
-        while url and len(all_users) < max_results:
-            resp = requests.get(url, headers=headers, params=params, timeout=15)
+        pages = 0
+        while url and (client_filter or len(all_users) < max_results):
+            if client_filter and pages >= BASIC_QUERY_MAX_PAGES:
+                break
+            pages += 1
+            resp = session.get(url, headers=headers, params=params, timeout=GRAPH_TIMEOUT)
             if not resp.ok:
                 error_msg = resp.json().get("error", {}).get("message", resp.text)
                 st.error(f"Graph API error: {error_msg}")
                 return all_users
 
-            data = resp.json()
+            data = parse_json(resp)
             users = data.get("value", [])
-            all_users.extend(users)
+            if client_domain:
+                users = [
+                    u for u in users
+                    if (u.get("mail") or u.get("userPrincipalName") or "").lower().endswith(client_domain)
+                ]
+            if client_filter:
+                all_users.extend(users)
+            else:
+                remaining = max_results - len(all_users)
+                all_users.extend(users[:remaining])
+                if len(users) >= remaining:
+                    break  # Enough users — don't request the next page
 
             # Pagination
             url = data.get("@odata.nextLink")
@@ -162,7 +226,11 @@ def fetch_domain_users(
     except Exception as e:
         st.error(f"Error fetching users: {e}")
 
-    return all_users[:max_results]
+    if client_filter:
+        all_users.sort(key=lambda u: (u.get("displayName") or "").lower())
+        del all_users[max_results:]
+
+    return all_users
 
 
 @st.cache_data(ttl=300, show_spinner="Loading users…")
@@ -170,12 +238,22 @@ def _cached_fetch_domain_users(
     domain: str,
     use_client_credentials: bool,
     max_results: int,
+    select_fields: tuple[str, ...] | None = None,
+    domain_server_filter: bool = True,
 ) -> list[dict[str, Any]]:
-    """Cached wrapper — results are cached for 5 minutes."""
+    """
+    Cached wrapper — results are cached for 5 minutes.
+
+    Concurrent callers with the same arguments are already deduplicated:
+    st.cache_data takes a per-key compute lock on a miss, so only the first
+    caller queries Graph and the rest receive the cached result.
+    """
     return fetch_domain_users(
         domain=domain,
         use_client_credentials=use_client_credentials,
+        select_fields=list(select_fields) if select_fields else None,
         max_results=max_results,
+        domain_server_filter=domain_server_filter,
     )
 
 
@@ -188,7 +266,7 @@ def render_user_select(
     label: str = "Select User",
     use_client_credentials: bool = True,
     include_email: bool = True,
-    max_results: int = 999,
+    max_results: int = DEFAULT_MAX_RESULTS,
     key: str = "user_select",
     cache: bool = True,
 ) -> dict[str, Any] | None:
@@ -207,11 +285,21 @@ def render_user_select(
     Returns:
         The selected user dict, or None if no selection.
     """
+    # Normalize so "IBTest.com" / " ibtest.com" share one cache entry
+    domain = (domain or "").strip().lower()
+
     # Fetch users
     if cache:
-        users = _cached_fetch_domain_users(domain, use_client_credentials, max_results)
+        users = _cached_fetch_domain_users(
+            domain, use_client_credentials, max_results, _PICKER_FIELDS,
+        )
     else:
-        users = fetch_domain_users(domain, use_client_credentials, max_results)
+        users = fetch_domain_users(
+            domain=domain,
+            use_client_credentials=use_client_credentials,
+            select_fields=list(_PICKER_FIELDS),
+            max_results=max_results,
+        )
 
     if not users:
         st.info("No users found.")
@@ -225,16 +313,18 @@ def render_user_select(
             return f"{name} ({email})"
         return name
 
-    options = [""] + [_display_name(u) for u in users]
+    # Options are user indices (-1 = empty choice); labels are built lazily
+    def _format_option(idx: int) -> str:
+        return "" if idx < 0 else _display_name(users[idx])
 
-    selected_label = st.selectbox(label, options=options, key=key)
+    selected_idx = st.selectbox(
+        label,
+        options=range(-1, len(users)),
+        format_func=_format_option,
+        key=key,
+    )
 
-    if not selected_label:
+    if selected_idx is None or selected_idx < 0:
         return None
 
-    # Find the matching user
-    idx = options.index(selected_label) - 1  # offset by 1 for the empty option
-    if 0 <= idx < len(users):
-        return users[idx]
-
-    return None
+    return users[selected_idx]
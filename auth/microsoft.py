@@ -27,15 +27,18 @@ Setup:
 from __future__ import annotations
 
 import base64
+import threading
+import time
 import urllib.parse
 import uuid
+from pathlib import Path
 from typing import Any
 
 import msal
-import requests
 import streamlit as st
 
 from config.settings import get_settings
+from utils.http import GRAPH_TIMEOUT, get_session, parse_json
 
 
 class MicrosoftAuth:
@@ -47,10 +50,21 @@ class MicrosoftAuth:
 
     GRAPH_ME_ENDPOINT = "https://graph.microsoft.com/v1.0/me"
     GRAPH_PHOTO_ENDPOINT = "https://graph.microsoft.com/v1.0/me/photo/$value"
+    GRAPH_BATCH_ENDPOINT = "https://graph.microsoft.com/v1.0/$batch"
+
+    # Photos larger than this are ignored (initials placeholder is shown)
+    MAX_PHOTO_BYTES = 512 * 1024
+
+    # session_state key holding the serialized per-user MSAL token cache
+    TOKEN_CACHE_KEY = "_msal_cache"
 
     def __init__(self) -> None:
         self._settings = get_settings()
         self._app: msal.ConfidentialClientApplication | None = None
+        self._cache = msal.SerializableTokenCache()
+        # The MSAL app is shared by every session in the process, so the
+        # cache is swapped in/out of session_state under a lock.
+        self._cache_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # MSAL Client
@@ -64,9 +78,19 @@ class MicrosoftAuth:
                 client_id=self._settings.azure_client_id,
                 client_credential=self._settings.azure_client_secret,
                 authority=self._settings.azure_authority,
+                token_cache=self._cache,
             )
         return self._app
 
+    def _load_cache(self) -> None:
+        """Load this session's serialized token cache into the MSAL app."""
+        self._cache.deserialize(st.session_state.get(self.TOKEN_CACHE_KEY) or "{}")
+
+    def _save_cache(self) -> None:
+        """Persist the token cache to session_state if MSAL changed it."""
+        if self._cache.has_state_changed:
+            st.session_state[self.TOKEN_CACHE_KEY] = self._cache.serialize()
+
     # ------------------------------------------------------------------
     # Auth Flow — Direct Authorization Code Exchange
     # ------------------------------------------------------------------
@@ -100,16 +124,20 @@ class MicrosoftAuth:
         Returns:
             Token result dict with 'access_token', or None on failure.
         """
-        result = self.msal_app.acquire_token_by_authorization_code(
-            code=code,
-            scopes=self._settings.azure_scopes,
-            redirect_uri=self._settings.azure_redirect_uri,
-        )
+        with self._cache_lock:
+            self._load_cache()
+            result = self.msal_app.acquire_token_by_authorization_code(
+                code=code,
+                scopes=self._settings.azure_scopes,
+                redirect_uri=self._settings.azure_redirect_uri,
+            )
+            self._save_cache()
 
         if "access_token" in result:
             st.session_state["token"] = result
             # Fetch and cache user profile
-            user = self._fetch_user_profile(result["access_token"])
+            user_id = (result.get("id_token_claims") or {}).get("oid", "")
+            user = self._fetch_user_profile(result["access_token"], user_id=user_id)
             st.session_state["user"] = user
             return result
 
@@ -118,52 +146,187 @@ class MicrosoftAuth:
         st.session_state["_auth_error"] = error
         return None
 
+    def acquire_token_silent(self) -> dict[str, Any] | None:
+        """
+        Return a valid token for the signed-in user from the session's MSAL
+        cache, refreshing it with the cached refresh token if it expired.
+
+        Returns:
+            Token result dict with 'access_token', or None if no cached
+            account/token is available.
+        """
+        if self.TOKEN_CACHE_KEY not in st.session_state:
+            return None
+
+        with self._cache_lock:
+            self._load_cache()
+            accounts = self.msal_app.get_accounts()
+            result = None
+            if accounts:
+                result = self.msal_app.acquire_token_silent(
+                    scopes=self._settings.azure_scopes,
+                    account=accounts[0],
+                )
+            self._save_cache()
+
+        if result and "access_token" in result:
+            st.session_state["token"] = result
+            return result
+        return None
+
     def logout(self) -> None:
         """Clear all authentication state from the session."""
-        for key in ("token", "user", "_auth_error"):
+        for key in ("token", "user", "_auth_error", self.TOKEN_CACHE_KEY):
             st.session_state.pop(key, None)
 
     # ------------------------------------------------------------------
     # User Profile
     # ------------------------------------------------------------------
 
-    def _fetch_user_profile(self, access_token: str) -> dict[str, Any]:
-        """Fetch the signed-in user's profile and photo from Microsoft Graph."""
-        headers = {"Authorization": f"Bearer {access_token}"}
-        resp = requests.get(self.GRAPH_ME_ENDPOINT, headers=headers, timeout=10)
-        if resp.ok:
-            data = resp.json()
-            profile = {
-                "name": data.get("displayName", "User"),
-                "email": data.get("mail") or data.get("userPrincipalName", ""),
-                "job_title": data.get("jobTitle", ""),
-                "id": data.get("id", ""),
-                "photo": None,
-            }
+    def _fetch_user_profile(self, access_token: str, user_id: str = "") -> dict[str, Any]:
+        """Fetch the signed-in user's profile and photo from Microsoft Graph.
+
+        Profile and photo are requested in a single $batch round-trip; if
+        the batch call fails, falls back to two sequential requests. Users
+        already known to have no photo (by Azure AD object id) skip the
+        photo request and only fetch /me.
+        """
+        skip_photo = bool(user_id) and _is_known_without_photo(user_id)
+        batched = None if skip_photo else self._fetch_profile_and_photo_batched(access_token)
+        if batched is not None:
+            data, photo = batched
+        else:
+            headers = {"Authorization": f"Bearer {access_token}"}
+            resp = get_session().get(self.GRAPH_ME_ENDPOINT, headers=headers, timeout=GRAPH_TIMEOUT)
+            if not resp.ok:
+                return {
+                    "name": "User", "email": "", "job_title": "", "id": "",
+                    "photo_bytes": None, "photo_content_type": None,
+                }
+            data = parse_json(resp)
             # Fetch profile photo (binary JPEG/PNG)
-            profile["photo"] = self._fetch_user_photo(access_token)
-            return profile
-        return {"name": "User", "email": "", "job_title": "", "id": "", "photo": None}
+            photo = None if skip_photo else self._fetch_user_photo(access_token, data.get("id", ""))
+
+        photo_bytes, photo_content_type = photo if photo else (None, None)
+        return {
+            "name": data.get("displayName", "User"),
+            "email": data.get("mail") or data.get("userPrincipalName", ""),
+            "job_title": data.get("jobTitle", ""),
+            "id": data.get("id", ""),
+            "photo_bytes": photo_bytes,
+            "photo_content_type": photo_content_type,
+        }
+
+    def _fetch_profile_and_photo_batched(
+        self, access_token: str,
+    ) -> tuple[dict[str, Any], tuple[bytes, str] | None] | None:
+        """Fetch /me and /me/photo/$value in one Graph $batch request.
 
-    def _fetch_user_photo(self, access_token: str) -> str | None:
-        """Fetch the user's profile photo as a base64 data URI.
+        Returns:
+            Tuple of (profile data, (photo bytes, content type) or None), or None if the
+            batch call itself or the /me sub-request failed.
+        """
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+        payload = {
+            "requests": [
+                {"id": "1", "method": "GET", "url": "/me"},
+                {
+                    "id": "2", "method": "GET", "url": "/me/photo/$value",
+                    "headers": {"Accept": "image/jpeg"},
+                },
+            ],
+        }
+        try:
+            resp = get_session().post(
+                self.GRAPH_BATCH_ENDPOINT, headers=headers, json=payload, timeout=GRAPH_TIMEOUT,
+            )
+            if not resp.ok:
+                return None
+            responses = {r.get("id"): r for r in parse_json(resp).get("responses", [])}
+        except Exception:
+            return None
+
+        me = responses.get("1", {})
+        if me.get("status") != 200:
+            return None
+
+        photo: tuple[bytes, str] | None = None
+        pic = responses.get("2", {})
+        me_id = (me.get("body") or {}).get("id")
+        if pic.get("status") == 404 and me_id:
+            _remember_no_photo(me_id)
+        # Binary sub-responses come back base64-encoded in "body"
+        if pic.get("status") == 200 and isinstance(pic.get("body"), str) and pic["body"]:
+            content_type = (pic.get("headers") or {}).get("Content-Type", "image/jpeg")
+            try:
+                content = base64.b64decode(pic["body"])
+                if len(content) <= self.MAX_PHOTO_BYTES:
+                    photo = (content, content_type)
+            except ValueError:
+                photo = None
+
+        return me.get("body") or {}, photo
+
+    def _fetch_user_photo(self, access_token: str, user_id: str = "") -> tuple[bytes, str] | None:
+        """Fetch the user's profile photo as raw bytes.
 
         Returns:
-            A data URI string like 'data:image/jpeg;base64,...' or None if
-            the user has no photo set.
+            Tuple of (image bytes, content type) or None if the user has no
+            photo set or it exceeds MAX_PHOTO_BYTES. Bytes are rendered with
+            st.image, which serves them from Streamlit's media endpoint
+            instead of inlining a data URI.
         """
         headers = {"Authorization": f"Bearer {access_token}"}
         try:
-            resp = requests.get(self.GRAPH_PHOTO_ENDPOINT, headers=headers, timeout=10)
-            if resp.ok and resp.content:
-                content_type = resp.headers.get("Content-Type", "image/jpeg")
-                b64 = base64.b64encode(resp.content).decode("utf-8")
-                return f"data:{content_type};base64,{b64}"
+            # Stream the body so an oversized photo is never fully buffered
+            with get_session().get(
+                self.GRAPH_PHOTO_ENDPOINT, headers=headers, timeout=GRAPH_TIMEOUT, stream=True,
+            ) as resp:
+                if resp.status_code == 404 and user_id:
+                    _remember_no_photo(user_id)
+                if not resp.ok:
+                    return None
+                content = resp.raw.read(self.MAX_PHOTO_BYTES + 1, decode_content=True)
+                if content and len(content) <= self.MAX_PHOTO_BYTES:
+                    content_type = resp.headers.get("Content-Type", "image/jpeg")
+                    return content, content_type
         except Exception:
             pass
         return None
 
 
+# A 404 on /me/photo is remembered this long, so a user who uploads a
+# photo later sees it after a few hours instead of after a restart.
+NO_PHOTO_TTL_S = 4 * 60 * 60
+
+_no_photo_lock = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_no_photo_users() -> dict[str, float]:
+    """Process-wide map of user id → time its /me/photo returned 404."""
+    return {}
+
+
+def _is_known_without_photo(user_id: str) -> bool:
+    """True if the user's photo 404'd within the last NO_PHOTO_TTL_S."""
+    seen = _get_no_photo_users().get(user_id)
+    return seen is not None and time.time() - seen < NO_PHOTO_TTL_S
+
+
+def _remember_no_photo(user_id: str) -> None:
+    """Record a photo 404 and drop expired entries so the map stays bounded."""
+    now = time.time()
+    no_photo = _get_no_photo_users()
+    with _no_photo_lock:
+        for uid in [uid for uid, seen in no_photo.items() if now - seen >= NO_PHOTO_TTL_S]:
+            del no_photo[uid]
+        no_photo[user_id] = now
+
+
 # ======================================================================
 # Convenience helpers — use these in your pages
 # ======================================================================
@@ -186,11 +349,22 @@ def is_authenticated() -> bool:
 def get_current_user() -> dict[str, Any]:
     """
     Return the current authenticated user dict.
-    Keys: name, email, job_title, id
+    Keys: name, email, job_title, id, photo_bytes, photo_content_type
     """
     return st.session_state.get("user", {"name": "Guest", "email": "", "job_title": "", "id": ""})
 
 
+def get_user_photo(user: dict[str, Any] | None = None) -> bytes | None:
+    """
+    Return the profile photo bytes for a user dict (defaults to the current
+    user), or None when no photo is available so callers can render a
+    placeholder.
+    """
+    if user is None:
+        user = get_current_user()
+    return user.get("photo_bytes") or None
+
+
 def require_auth() -> None:
     """
     Gate that blocks page rendering if the user is not authenticated.
@@ -247,46 +421,56 @@ def do_logout() -> None:
 # Login UI
 # ======================================================================
 
-def _render_login_page() -> None:
-    """Render a professional login page with Microsoft sign-in button."""
-    settings = get_settings()
+# The sign-in URL carries a fresh ``state`` on every call, so it is
+# substituted after the cached HTML is built instead of being part of the key.
+_AUTH_URL_PLACEHOLDER = "__AUTH_URL__"
+
+_LOGO_PATH = Path(__file__).resolve().parent.parent / "img" / "logo_ibtest.png"
+_MS_ICON_URL = "https://img.icons8.com/?size=100&id=22989&format=png&color=000000"
 
-    ms_icon = "https://img.icons8.com/?size=100&id=22989&format=png&color=000000"
 
-    # Encode local logo as base64 data URI for st.html
-    import base64 as _b64
-    from pathlib import Path as _Path
-    _logo_path = _Path(__file__).resolve().parent.parent / "img" / "logo_ibtest.png"
-    _logo_uri = ""
-    if _logo_path.exists():
-        _logo_b64 = _b64.b64encode(_logo_path.read_bytes()).decode("utf-8")
-        _logo_uri = f"data:image/png;base64,{_logo_b64}"
+@st.cache_resource(show_spinner=False)
+def _get_logo_data_uri() -> str:
+    """Read and base64-encode the local logo once per process."""
+    if not _LOGO_PATH.exists():
+        return ""
+    logo_b64 = base64.b64encode(_LOGO_PATH.read_bytes()).decode("utf-8")
+    return f"data:image/png;base64,{logo_b64}"
 
-    auth_url = _get_auth().get_auth_url() if settings.azure_client_id else "#"
-    disabled_style = "pointer-events:none; opacity:0.5;" if not settings.azure_client_id else ""
 
-    html = (
+@st.cache_resource(show_spinner=False)
+def _build_login_html(app_name: str, app_description: str, client_id_present: bool) -> str:
+    """Build the login card HTML once per (app name, description, config) combo."""
+    logo_uri = _get_logo_data_uri()
+    disabled_style = "pointer-events:none; opacity:0.5;" if not client_id_present else ""
+
+    logo_block = (
+        f'    <img src="{logo_uri}" alt="Logo"'
+        '         style="width:140px; margin:0 auto 1rem; display:block;" />'
+        if logo_uri else ''
+    )
+
+    # Adjacent literals form a single f-string — no intermediate "+" copies.
+    return (
         '<div style="display:flex; flex-direction:column; align-items:center;'
         ' justify-content:center; min-height:65vh; text-align:center;">'
         '  <div style="background:white; border:1px solid #E5E7EB; border-radius:16px;'
         '              padding:2.5rem 2.5rem 2rem; max-width:500px; width:100%;'
         '              box-shadow:0 4px 24px rgba(0,0,0,0.08);">'
-        + (f'    <img src="{_logo_uri}" alt="Logo"'
-           '         style="width:140px; margin:0 auto 1rem; display:block;" />'
-           if _logo_uri else '')
-        + '    <h1 style="margin:0 0 0.4rem; color:#1E1E1E; font-weight:800;'
+        f'{logo_block}'
+        '    <h1 style="margin:0 0 0.4rem; color:#1E1E1E; font-weight:800;'
         '               font-size:2.2rem; letter-spacing:-0.5px;">'
-        f'      {settings.app_name}'
+        f'      {app_name}'
         '    </h1>'
         '    <p style="color:#6B7280; margin:0 0 2rem; font-size:0.95rem; line-height:1.4;">'
-        f'      {settings.app_description}'
+        f'      {app_description}'
         '    </p>'
-        f'    <a href="{auth_url}"'
+        f'    <a href="{_AUTH_URL_PLACEHOLDER}"'
         '       style="display:flex; align-items:center; justify-content:center; gap:0.6rem;'
         '              background:#1E1E1E; color:white; text-decoration:none;'
         '              padding:0.75rem 1.5rem; border-radius:8px; font-size:0.95rem;'
         f'              font-weight:600; {disabled_style}">'
-        f'      <img src="{ms_icon}" alt="Microsoft" style="width:40px; height:40px;" />'
+        f'      <img src="{_MS_ICON_URL}" alt="Microsoft" style="width:40px; height:40px;" />'
         '       Iniciar sesi\u00f3n con Microsoft 365'
         '    </a>'
         '    <div style="display:flex; align-items:center; gap:1rem; margin:1.5rem 0 1rem;">'
@@ -303,6 +487,17 @@ def _render_login_page() -> None:
         '</div>'
     )
 
+
+def _render_login_page() -> None:
+    """Render a professional login page with Microsoft sign-in button."""
+    settings = get_settings()
+    client_id_present = bool(settings.azure_client_id)
+
+    auth_url = _get_auth().get_auth_url() if client_id_present else "#"
+    html = _build_login_html(
+        settings.app_name, settings.app_description, client_id_present,
+    ).replace(_AUTH_URL_PLACEHOLDER, auth_url)
+
     st.html(html)
 
     if not settings.azure_client_id:
@@ -4,6 +4,8 @@ Chart Components (Plotly)
 ============================================================================
 Professional, reusable chart wrappers with consistent theming.
 All charts follow the application color palette and are fully interactive.
+Figures are built by cached builders, so reruns with unchanged inputs
+skip Plotly trace construction; only st.plotly_chart runs.
 
 Usage:
     from components import render_bar_chart, render_line_chart
@@ -15,8 +17,10 @@ Usage:
 
 from __future__ import annotations
 
+import html
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -29,42 +33,143 @@ from config.theme import theme
 # Shared layout defaults
 # ======================================================================
 
+# Built once at import: Plotly copies layout values into the figure, so the
+# nested dicts are never mutated and can be shared across charts.
+_BASE_LAYOUT: dict[str, Any] = dict(
+    font=dict(family="Segoe UI, sans-serif", color=theme.colors.text_primary),
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="rgba(0,0,0,0)",
+    margin=dict(l=40, r=20, t=50, b=40),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1,
+        font=dict(size=12),
+    ),
+    xaxis=dict(
+        showgrid=False,
+        linecolor=theme.colors.border,
+        linewidth=1,
+    ),
+    yaxis=dict(
+        gridcolor="#F0F0F0",
+        gridwidth=1,
+        linecolor=theme.colors.border,
+        linewidth=1,
+    ),
+    hoverlabel=dict(
+        bgcolor="white",
+        font_size=13,
+        font_family="Segoe UI, sans-serif",
+    ),
+)
+
+
+# Cached figures are shared across reruns and sessions (st.cache_resource
+# returns the object itself). st.cache_data would pickle/unpickle the
+# Figure on every hit, and unpickling re-validates every trace — slower
+# than serializing it. Cached figures must therefore never be mutated.
+_FIG_CACHE_ENTRIES = 64
+
+# Theme-dependent fragments reused by the individual chart helpers.
+_CATEGORICAL_COLORS: tuple[str, ...] = tuple(theme.chart_colors.categorical)
+_TITLE_FONT: dict[str, Any] = dict(size=16, color=theme.colors.text_primary)
+
+# Plotly.js client configs. Interactive charts keep hover/zoom but drop the
+# mode bar; static ones skip event handler setup entirely.
+_INTERACTIVE_CONFIG: dict[str, Any] = {"displayModeBar": False, "responsive": True}
+_STATIC_CONFIG: dict[str, Any] = {"staticPlot": True, "displayModeBar": False}
+
+
 def _base_layout(**overrides: Any) -> dict[str, Any]:
     """Return a base Plotly layout dict with professional styling."""
-    layout = dict(
-        font=dict(family="Segoe UI, sans-serif", color=theme.colors.text_primary),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        margin=dict(l=40, r=20, t=50, b=40),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(size=12),
-        ),
-        xaxis=dict(
-            showgrid=False,
-            linecolor=theme.colors.border,
-            linewidth=1,
-        ),
-        yaxis=dict(
-            gridcolor="#F0F0F0",
-            gridwidth=1,
-            linecolor=theme.colors.border,
-            linewidth=1,
-        ),
-        hoverlabel=dict(
-            bgcolor="white",
-            font_size=13,
-            font_family="Segoe UI, sans-serif",
-        ),
-    )
-    layout.update(overrides)
+    layout = {**_BASE_LAYOUT}
+    if overrides:
+        layout.update(overrides)
     return layout
 
 
+# ======================================================================
+# Time-series downsampling (LTTB)
+# ======================================================================
+
+# Line/area charts with more rows than this are reduced to about
+# _DOWNSAMPLE_POINTS per y-column (per color group) before plotting.
+_DOWNSAMPLE_THRESHOLD = 3000
+_DOWNSAMPLE_POINTS = 2000
+# Above this many points line charts are drawn with WebGL (scattergl).
+_WEBGL_THRESHOLD = 1000
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int = _DOWNSAMPLE_POINTS) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: pick n_out indices that preserve the
+    visual shape of the (x, y) series. x must be sorted ascending.
+
+    Returns:
+        Sorted array of selected row positions.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Triangle area between the last pick, each candidate and the next bucket's mean
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def _downsample(
+    df: pd.DataFrame,
+    x: str,
+    y: str | list[str],
+    color: str | None = None,
+) -> pd.DataFrame:
+    """Reduce a long time series with LTTB; non-numeric x is left untouched."""
+    if len(df) <= _DOWNSAMPLE_THRESHOLD or x not in df.columns:
+        return df
+
+    if color and color in df.columns:
+        return pd.concat(
+            [_downsample(group, x, y) for _, group in df.groupby(color, sort=False, observed=True)],
+        )
+
+    x_col = df[x]
+    if pd.api.types.is_datetime64_any_dtype(x_col):
+        x_values = x_col.astype("int64").to_numpy(dtype=float)
+    elif pd.api.types.is_numeric_dtype(x_col):
+        x_values = x_col.to_numpy(dtype=float)
+    else:
+        return df
+
+    if not x_col.is_monotonic_increasing:
+        order = np.argsort(x_values, kind="stable")
+        df, x_values = df.iloc[order], x_values[order]
+
+    # Union of the points LTTB keeps for each series keeps rows aligned
+    keep = np.zeros(len(df), dtype=bool)
+    for col in [y] if isinstance(y, str) else y:
+        y_values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
+        keep[_lttb(x_values, np.nan_to_num(y_values))] = True
+    return df[keep]
+
+
 # ======================================================================
 # Generic renderer
 # ======================================================================
@@ -73,19 +178,47 @@ def render_plotly_chart(
     fig: go.Figure,
     use_container_width: bool = True,
     key: str | None = None,
+    config: dict[str, Any] | None = None,
 ) -> None:
     """
     Render any Plotly figure with consistent styling applied.
     Use this when you build a custom figure and want theme consistency.
+    ``config`` overrides the Plotly.js client config (default: no mode bar).
     """
     fig.update_layout(**_base_layout())
-    st.plotly_chart(fig, width="stretch" if use_container_width else "content", key=key)
+    st.plotly_chart(
+        fig,
+        width="stretch" if use_container_width else "content",
+        key=key,
+        config=config if config is not None else _INTERACTIVE_CONFIG,
+    )
 
 
 # ======================================================================
 # Bar Chart
 # ======================================================================
 
+@st.cache_resource(show_spinner=False, max_entries=_FIG_CACHE_ENTRIES)
+def _build_bar_fig(
+    df: pd.DataFrame,
+    x: str,
+    y: str | list[str],
+    title: str,
+    color: str | None,
+    orientation: str,
+    barmode: str,
+) -> go.Figure:
+    """Build (and cache) the styled bar chart figure."""
+    fig = px.bar(
+        df, x=x, y=y, color=color, title=title,
+        orientation=orientation, barmode=barmode,
+        color_discrete_sequence=_CATEGORICAL_COLORS,
+    )
+    fig.update_layout(**_base_layout(title=dict(text=title, font=_TITLE_FONT)))
+    fig.update_traces(marker_line_width=0, opacity=0.9)
+    return fig
+
+
 def render_bar_chart(
     df: pd.DataFrame,
     x: str,
@@ -109,20 +242,37 @@ def render_bar_chart(
         barmode: 'group', 'stack', 'overlay', 'relative'.
         key: Streamlit widget key.
     """
-    fig = px.bar(
-        df, x=x, y=y, color=color, title=title,
-        orientation=orientation, barmode=barmode,
-        color_discrete_sequence=list(theme.chart_colors.categorical),
-    )
-    fig.update_layout(**_base_layout(title=dict(text=title, font=dict(size=16, color=theme.colors.text_primary))))
-    fig.update_traces(marker_line_width=0, opacity=0.9)
-    st.plotly_chart(fig, width="stretch", key=key)
+    fig = _build_bar_fig(df, x, y, title, color, orientation, barmode)
+    st.plotly_chart(fig, width="stretch", key=key, config=_INTERACTIVE_CONFIG)
 
 
 # ======================================================================
 # Line Chart
 # ======================================================================
 
+@st.cache_resource(show_spinner=False, max_entries=_FIG_CACHE_ENTRIES)
+def _build_line_fig(
+    df: pd.DataFrame,
+    x: str,
+    y: str | list[str],
+    title: str,
+    color: str | None,
+    markers: bool,
+    downsample: bool,
+) -> go.Figure:
+    """Build (and cache) the styled line chart figure."""
+    if downsample:
+        df = _downsample(df, x, y, color)
+    fig = px.line(
+        df, x=x, y=y, color=color, title=title, markers=markers,
+        color_discrete_sequence=_CATEGORICAL_COLORS,
+        render_mode="webgl" if len(df) > _WEBGL_THRESHOLD else "auto",
+    )
+    fig.update_layout(**_base_layout(title=dict(text=title, font=_TITLE_FONT)))
+    fig.update_traces(line=dict(width=2.5))
+    return fig
+
+
 def render_line_chart(
     df: pd.DataFrame,
     x: str,
@@ -131,6 +281,7 @@ def render_line_chart(
     color: str | None = None,
     markers: bool = True,
     key: str | None = None,
+    downsample: bool = True,
 ) -> None:
     """
     Professional line chart with optional markers.
@@ -143,20 +294,34 @@ def render_line_chart(
         color: Column for color grouping.
         markers: Show data point markers.
         key: Streamlit widget key.
+        downsample: Reduce series longer than 3000 rows with LTTB.
     """
-    fig = px.line(
-        df, x=x, y=y, color=color, title=title, markers=markers,
-        color_discrete_sequence=list(theme.chart_colors.categorical),
-    )
-    fig.update_layout(**_base_layout(title=dict(text=title, font=dict(size=16))))
-    fig.update_traces(line=dict(width=2.5))
-    st.plotly_chart(fig, width="stretch", key=key)
+    fig = _build_line_fig(df, x, y, title, color, markers, downsample)
+    st.plotly_chart(fig, width="stretch", key=key, config=_INTERACTIVE_CONFIG)
 
 
 # ======================================================================
 # Pie / Donut Chart
 # ======================================================================
 
+@st.cache_resource(show_spinner=False, max_entries=_FIG_CACHE_ENTRIES)
+def _build_pie_fig(
+    df: pd.DataFrame,
+    names: str,
+    values: str,
+    title: str,
+    hole: float,
+) -> go.Figure:
+    """Build (and cache) the styled pie/donut chart figure."""
+    fig = px.pie(
+        df, names=names, values=values, title=title, hole=hole,
+        color_discrete_sequence=_CATEGORICAL_COLORS,
+    )
+    fig.update_layout(**_base_layout(title=dict(text=title, font=_TITLE_FONT)))
+    fig.update_traces(textposition="inside", textinfo="percent+label")
+    return fig
+
+
 def render_pie_chart(
     df: pd.DataFrame,
     names: str,
@@ -164,6 +329,7 @@ def render_pie_chart(
     title: str = "",
     hole: float = 0.4,
     key: str | None = None,
+    static: bool = True,
 ) -> None:
     """
     Professional donut/pie chart.
@@ -175,20 +341,40 @@ def render_pie_chart(
         title: Chart title.
         hole: 0 for pie, 0.3–0.5 for donut.
         key: Streamlit widget key.
+        static: Render without hover/click handlers (labels already show
+            percent + name). Pass False to keep tooltips.
     """
-    fig = px.pie(
-        df, names=names, values=values, title=title, hole=hole,
-        color_discrete_sequence=list(theme.chart_colors.categorical),
+    fig = _build_pie_fig(df, names, values, title, hole)
+    st.plotly_chart(
+        fig, width="stretch", key=key,
+        config=_STATIC_CONFIG if static else _INTERACTIVE_CONFIG,
     )
-    fig.update_layout(**_base_layout(title=dict(text=title, font=dict(size=16))))
-    fig.update_traces(textposition="inside", textinfo="percent+label")
-    st.plotly_chart(fig, width="stretch", key=key)
 
 
 # ======================================================================
 # Area Chart
 # ======================================================================
 
+@st.cache_resource(show_spinner=False, max_entries=_FIG_CACHE_ENTRIES)
+def _build_area_fig(
+    df: pd.DataFrame,
+    x: str,
+    y: str | list[str],
+    title: str,
+    color: str | None,
+    downsample: bool,
+) -> go.Figure:
+    """Build (and cache) the styled area chart figure."""
+    if downsample:
+        df = _downsample(df, x, y, color)
+    fig = px.area(
+        df, x=x, y=y, color=color, title=title,
+        color_discrete_sequence=_CATEGORICAL_COLORS,
+    )
+    fig.update_layout(**_base_layout(title=dict(text=title, font=_TITLE_FONT)))
+    return fig
+
+
 def render_area_chart(
     df: pd.DataFrame,
     x: str,
@@ -196,14 +382,11 @@ def render_area_chart(
     title: str = "",
     color: str | None = None,
     key: str | None = None,
+    downsample: bool = True,
 ) -> None:
-    """Professional stacked area chart."""
-    fig = px.area(
-        df, x=x, y=y, color=color, title=title,
-        color_discrete_sequence=list(theme.chart_colors.categorical),
-    )
-    fig.update_layout(**_base_layout(title=dict(text=title, font=dict(size=16))))
-    st.plotly_chart(fig, width="stretch", key=key)
+    """Professional stacked area chart (long series are LTTB-downsampled)."""
+    fig = _build_area_fig(df, x, y, title, color, downsample)
+    st.plotly_chart(fig, width="stretch", key=key, config=_INTERACTIVE_CONFIG)
 
 
 # ======================================================================
@@ -219,7 +402,7 @@ def render_kpi_chart(
     key: str | None = None,
 ) -> None:
     """
-    Render a KPI indicator gauge.
+    Render a KPI indicator (number + relative delta) as a lightweight HTML card.
 
     Args:
         value: Current value.
@@ -227,24 +410,32 @@ def render_kpi_chart(
         title: KPI title.
         prefix: Value prefix (e.g. '$').
         suffix: Value suffix (e.g. '%').
-        key: Streamlit widget key.
+        key: Unused; kept for backwards compatibility with the Plotly version.
     """
-    fig = go.Figure(
-        go.Indicator(
-            mode="number+delta" if reference is not None else "number",
-            value=value,
-            delta=dict(reference=reference, relative=True, valueformat=".1%") if reference else None,
-            title=dict(text=title, font=dict(size=14, color=theme.colors.text_secondary)),
-            number=dict(
-                prefix=prefix,
-                suffix=suffix,
-                font=dict(size=36, color=theme.colors.text_primary, family="Segoe UI"),
-            ),
+    number = f"{value:,.0f}" if float(value).is_integer() else f"{value:,.2f}"
+
+    delta_html = ""
+    if reference:
+        delta_pct = (value - reference) / abs(reference)
+        color = theme.colors.success if delta_pct >= 0 else theme.colors.danger
+        arrow = "▲" if delta_pct >= 0 else "▼"
+        delta_html = (
+            f'<div style="font-size:1rem; color:{color};">'
+            f"{arrow} {abs(delta_pct):.1%}</div>"
         )
+
+    st.markdown(
+        f"""
+        <div style="text-align:center; padding:0.75rem 0; font-family:'Segoe UI', sans-serif;">
+            <div style="font-size:0.9rem; color:{theme.colors.text_secondary};">
+                {html.escape(title)}
+            </div>
+            <div style="font-size:2.25rem; font-weight:600; color:{theme.colors.text_primary};
+                        line-height:1.2;">
+                {html.escape(prefix)}{number}{html.escape(suffix)}
+            </div>
+            {delta_html}
+        </div>
+        """,
+        unsafe_allow_html=True,
     )
-    fig.update_layout(
-        height=150,
-        margin=dict(l=20, r=20, t=40, b=20),
-        paper_bgcolor="rgba(0,0,0,0)",
-    )
-    st.plotly_chart(fig, width="stretch", key=key)
@@ -27,7 +27,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 import streamlit as st
 
@@ -36,6 +36,10 @@ import streamlit as st
 # Field Definition
 # ======================================================================
 
+# Field types whose widgets take a string value ("" when unset)
+_TEXT_TYPES = frozenset({"text", "email", "password", "textarea"})
+
+
 @dataclass
 class FormField:
     """
@@ -80,11 +84,29 @@ class FormField:
     disabled: bool = False
     width: int = 1
 
+    # Compiled form of ``regex`` (built once in __post_init__)
+    _regex_compiled: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._regex_compiled = re.compile(self.regex) if self.regex else None
+        # Normalize empty defaults once so renderers can pass them through
+        if self.type in _TEXT_TYPES:
+            self.default = self.default or ""
+        elif self.type == "multiselect":
+            self.default = self.default or []
+        elif self.type == "checkbox":
+            self.default = bool(self.default)
+
 
 # ======================================================================
 # Validation Engine
 # ======================================================================
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
+
 def validate_fields(fields: list[FormField], values: dict[str, Any]) -> dict[str, str]:
     """
     Validate a dict of values against a list of FormField definitions.
@@ -97,38 +119,33 @@ def validate_fields(fields: list[FormField], values: dict[str, Any]) -> dict[str
 
     for f in fields:
         val = values.get(f.key)
+        stripped = val.strip() if isinstance(val, str) else None
 
-        # --- Required ---
-        if f.required:
-            if val is None or (isinstance(val, str) and val.strip() == ""):
-                errors[f.key] = f"{f.label} is required."
-                continue
-            if isinstance(val, list) and len(val) == 0:
+        # --- Required / empty ---
+        # Empty values fail only when required; otherwise skip further checks
+        if val is None or stripped == "" or (isinstance(val, list) and not val):
+            if f.required:
                 errors[f.key] = f"{f.label} is required."
-                continue
-
-        # Skip further checks if value is empty and not required
-        if val is None or (isinstance(val, str) and val.strip() == ""):
             continue
 
         # --- Email format ---
         if f.type == "email":
-            email_re = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-            if not re.match(email_re, str(val)):
+            if not _EMAIL_RE.match(str(val)):
                 errors[f.key] = "Enter a valid email address."
                 continue
 
         # --- String length ---
-        if isinstance(val, str):
-            if f.min_length is not None and len(val.strip()) < f.min_length:
+        if stripped is not None and (f.min_length is not None or f.max_length is not None):
+            length = len(stripped)
+            if f.min_length is not None and length < f.min_length:
                 errors[f.key] = f"{f.label} must be at least {f.min_length} characters."
                 continue
-            if f.max_length is not None and len(val.strip()) > f.max_length:
+            if f.max_length is not None and length > f.max_length:
                 errors[f.key] = f"{f.label} must be at most {f.max_length} characters."
                 continue
 
         # --- Numeric range ---
-        if f.type == "number" and val is not None:
+        if f.type == "number":
             if f.min_value is not None and val < f.min_value:
                 errors[f.key] = f"{f.label} must be ≥ {f.min_value}."
                 continue
@@ -137,8 +154,8 @@ def validate_fields(fields: list[FormField], values: dict[str, Any]) -> dict[str
                 continue
 
         # --- Regex ---
-        if f.regex and isinstance(val, str):
-            if not re.match(f.regex, val):
+        if f._regex_compiled is not None and stripped is not None:
+            if not f._regex_compiled.match(val):
                 errors[f.key] = f.regex_msg
                 continue
 
@@ -187,8 +204,7 @@ def validated_form(
     if submitted:
         errors = validate_fields(fields, values)
         if errors:
-            for field_key, msg in errors.items():
-                st.error(f"**{field_key}**: {msg}")
+            st.error("\n\n".join(f"**{k}**: {v}" for k, v in errors.items()))
             return None
         return values
 
@@ -205,73 +221,115 @@ def _render_fields_multi_column(
     num_cols: int,
     form_key: str,
 ) -> None:
-    """Render fields in a multi-column grid."""
+    """Render fields in a multi-column grid (field i goes to column i % num_cols)."""
     cols = st.columns(num_cols)
-    for idx, f in enumerate(fields):
-        with cols[idx % num_cols]:
-            values[f.key] = _render_single_field(f, form_key)
+    rendered: dict[str, Any] = {}
+    # Enter each column once and render its whole slice of fields
+    for col_idx, col in enumerate(cols):
+        with col:
+            for f in fields[col_idx::num_cols]:
+                rendered[f.key] = _render_single_field(f, form_key)
+    # Keep values in field order, as the single-column path does
+    for f in fields:
+        values[f.key] = rendered[f.key]
 
 
 def _render_single_field(f: FormField, form_key: str) -> Any:
     """Render a single form field and return its value."""
     widget_key = f"{form_key}_{f.key}"
     label = f"{'* ' if f.required else ''}{f.label}"
+    return _FIELD_RENDERERS.get(f.type, _render_fallback)(f, label, widget_key)
+
+
+def _render_text(f: FormField, label: str, widget_key: str) -> Any:
+    return st.text_input(
+        label, value=f.default, placeholder=f.placeholder,
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+        max_chars=f.max_length,
+    )
+
+
+def _render_email(f: FormField, label: str, widget_key: str) -> Any:
+    return st.text_input(
+        label, value=f.default, placeholder=f.placeholder or "user@example.com",
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+    )
+
+
+def _render_password(f: FormField, label: str, widget_key: str) -> Any:
+    return st.text_input(
+        label, value=f.default, type="password",
+        placeholder=f.placeholder, help=f.help_text,
+        disabled=f.disabled, key=widget_key,
+    )
+
+
+def _render_textarea(f: FormField, label: str, widget_key: str) -> Any:
+    return st.text_area(
+        label, value=f.default, placeholder=f.placeholder,
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+        max_chars=f.max_length,
+    )
+
+
+def _render_number(f: FormField, label: str, widget_key: str) -> Any:
+    return st.number_input(
+        label, value=f.default, min_value=f.min_value, max_value=f.max_value,
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+    )
+
+
+def _render_date(f: FormField, label: str, widget_key: str) -> Any:
+    return st.date_input(
+        label, value=f.default or date.today(),
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+    )
+
+
+def _render_time(f: FormField, label: str, widget_key: str) -> Any:
+    return st.time_input(
+        label, value=f.default,
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+    )
+
+
+def _render_select(f: FormField, label: str, widget_key: str) -> Any:
+    options = f.options or []
+    index = options.index(f.default) if f.default in options else 0
+    return st.selectbox(
+        label, options=options, index=index,
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+    )
+
+
+def _render_multiselect(f: FormField, label: str, widget_key: str) -> Any:
+    return st.multiselect(
+        label, options=f.options or [], default=f.default,
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+    )
+
+
+def _render_checkbox(f: FormField, label: str, widget_key: str) -> Any:
+    return st.checkbox(
+        label, value=f.default,
+        help=f.help_text, disabled=f.disabled, key=widget_key,
+    )
+
+
+def _render_fallback(f: FormField, label: str, widget_key: str) -> Any:
+    return st.text_input(label, value=f.default or "", key=widget_key)
+
 
-    match f.type:
-        case "text":
-            return st.text_input(
-                label, value=f.default or "", placeholder=f.placeholder,
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-                max_chars=f.max_length,
-            )
-        case "email":
-            return st.text_input(
-                label, value=f.default or "", placeholder=f.placeholder or "user@example.com",
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-            )
-        case "password":
-            return st.text_input(
-                label, value=f.default or "", type="password",
-                placeholder=f.placeholder, help=f.help_text,
-                disabled=f.disabled, key=widget_key,
-            )
-        case "textarea":
-            return st.text_area(
-                label, value=f.default or "", placeholder=f.placeholder,
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-                max_chars=f.max_length,
-            )
-        case "number":
-            return st.number_input(
-                label, value=f.default, min_value=f.min_value, max_value=f.max_value,
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-            )
-        case "date":
-            return st.date_input(
-                label, value=f.default or date.today(),
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-            )
-        case "time":
-            return st.time_input(
-                label, value=f.default,
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-            )
-        case "select":
-            options = f.options or []
-            index = options.index(f.default) if f.default in options else 0
-            return st.selectbox(
-                label, options=options, index=index,
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-            )
-        case "multiselect":
-            return st.multiselect(
-                label, options=f.options or [], default=f.default or [],
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-            )
-        case "checkbox":
-            return st.checkbox(
-                label, value=bool(f.default),
-                help=f.help_text, disabled=f.disabled, key=widget_key,
-            )
-        case _:
-            return st.text_input(label, value=f.default or "", key=widget_key)
+# Field type → renderer(field, label, widget_key)
+_FIELD_RENDERERS: dict[str, Callable[[FormField, str, str], Any]] = {
+    "text": _render_text,
+    "email": _render_email,
+    "password": _render_password,
+    "textarea": _render_textarea,
+    "number": _render_number,
+    "date": _render_date,
+    "time": _render_time,
+    "select": _render_select,
+    "multiselect": _render_multiselect,
+    "checkbox": _render_checkbox,
+}
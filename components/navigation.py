@@ -15,12 +15,12 @@ Usage:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import streamlit as st
-from streamlit_option_menu import option_menu
 
-from auth.microsoft import is_authenticated, get_current_user, do_logout
+from auth.microsoft import is_authenticated, get_current_user, get_user_photo, do_logout
 from config.settings import get_settings
 from config.theme import theme
 
@@ -38,6 +38,31 @@ PAGE_REGISTRY: list[dict[str, str]] = [
     {"name": "Configuración",    "icon": "gear"},
 ]
 
+# Session-state key holding the page selected in the sidebar.
+CURRENT_PAGE_KEY = "_current_page"
+
+# Derived once at import: the registry and theme are constant per process.
+_PAGE_NAMES: list[str] = [p["name"] for p in PAGE_REGISTRY]
+_PAGE_ICONS: list[str] = [p["icon"] for p in PAGE_REGISTRY]
+
+_MENU_STYLES: dict[str, dict[str, str]] = {
+    "container": {"padding": "0", "background-color": "transparent"},
+    "icon": {"color": theme.colors.primary, "font-size": "1rem"},
+    "nav-link": {
+        "font-size": "0.9rem",
+        "text-align": "left",
+        "margin": "2px 0",
+        "padding": "0.6rem 1rem",
+        "border-radius": "6px",
+        "--hover-color": theme.colors.primary_light,
+    },
+    "nav-link-selected": {
+        "background-color": theme.colors.primary,
+        "color": "white",
+        "font-weight": "600",
+    },
+}
+
 
 # ======================================================================
 # Sidebar
@@ -50,62 +75,68 @@ def render_sidebar() -> str:
     Returns:
         The name of the currently selected page.
     """
+    with st.sidebar:
+        _render_sidebar_fragment()
+    return st.session_state[CURRENT_PAGE_KEY]
+
+
+@st.fragment
+def _render_sidebar_fragment() -> None:
+    """
+    Sidebar body, isolated as a fragment so its widgets (e.g. the logout
+    button) rerun only the sidebar. A page change triggers a full app
+    rerun so the router picks up the new selection.
+    """
+    # Deferred so the login page doesn't import the option-menu component.
+    from streamlit_option_menu import option_menu
+
     settings = get_settings()
 
-    with st.sidebar:
-        # --- App branding (logo + name) ---
-        logo_col1, logo_col2, logo_col3 = st.columns([1, 2, 1])
-        with logo_col2:
-            st.image("img/logo_ibtest.png", width=120)
-        st.markdown(
-            f"""
+    # --- App branding (logo + name) ---
+    logo_col1, logo_col2, logo_col3 = st.columns([1, 2, 1])
+    with logo_col2:
+        st.image("img/logo_ibtest.png", width=120)
+    st.markdown(
+        _build_branding_html(settings.app_name, settings.app_version),
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+
+    # --- Navigation menu ---
+    selected = option_menu(
+        menu_title=None,
+        options=_PAGE_NAMES,
+        icons=_PAGE_ICONS,
+        default_index=0,
+        styles=_MENU_STYLES,
+    )
+    previous = st.session_state.get(CURRENT_PAGE_KEY)
+    st.session_state[CURRENT_PAGE_KEY] = selected
+    if previous is not None and previous != selected:
+        st.rerun()
+
+    # --- Spacer ---
+    st.markdown("<div style='flex:1;'></div>", unsafe_allow_html=True)
+
+    # --- User menu ---
+    st.markdown("---")
+    render_user_menu()
+
+
+@st.cache_resource(show_spinner=False)
+def _build_branding_html(app_name: str, app_version: str) -> str:
+    """Build the sidebar branding block (app name + version)."""
+    return f"""
             <div style="text-align:center; padding:0 0 0.5rem;">
                 <h3 style="margin:0; color:{theme.colors.primary}; font-weight:700;">
-                    {settings.app_name}
+                    {app_name}
                 </h3>
                 <span style="font-size:0.75rem; color:{theme.colors.text_muted};">
-                    v{settings.app_version}
+                    v{app_version}
                 </span>
             </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-        st.markdown("---")
-
-        # --- Navigation menu ---
-        selected = option_menu(
-            menu_title=None,
-            options=[p["name"] for p in PAGE_REGISTRY],
-            icons=[p["icon"] for p in PAGE_REGISTRY],
-            default_index=0,
-            styles={
-                "container": {"padding": "0", "background-color": "transparent"},
-                "icon": {"color": theme.colors.primary, "font-size": "1rem"},
-                "nav-link": {
-                    "font-size": "0.9rem",
-                    "text-align": "left",
-                    "margin": "2px 0",
-                    "padding": "0.6rem 1rem",
-                    "border-radius": "6px",
-                    "--hover-color": theme.colors.primary_light,
-                },
-                "nav-link-selected": {
-                    "background-color": theme.colors.primary,
-                    "color": "white",
-                    "font-weight": "600",
-                },
-            },
-        )
-
-        # --- Spacer ---
-        st.markdown("<div style='flex:1;'></div>", unsafe_allow_html=True)
-
-        # --- User menu ---
-        st.markdown("---")
-        render_user_menu()
-
-    return selected
+            """
 
 
 # ======================================================================
@@ -116,50 +147,27 @@ def render_user_menu() -> None:
     """Render user info and logout button in the sidebar."""
     user = get_current_user()
 
-    photo = user.get("photo")
+    photo = get_user_photo(user)
 
     # Use columns to place avatar next to user info
     col_avatar, col_info = st.columns([1, 3], gap="small")
 
     with col_avatar:
         if photo:
-            # Decode base64 data URI to bytes for st.image (sidebar-safe)
-            import base64 as _b64
+            # Raw bytes are served via Streamlit's media endpoint (sidebar-safe)
             try:
-                b64_data = photo.split(",", 1)[1]
-                img_bytes = _b64.b64decode(b64_data)
-                st.image(img_bytes, width=36)
+                st.image(photo, width=36)
             except Exception:
                 st.markdown(f"**{_get_initials(user.get('name', 'U'))}**")
         else:
             st.markdown(
-                f"""
-                <div style="
-                    width:36px; height:36px; border-radius:50%;
-                    background:{theme.colors.primary}; color:white;
-                    display:flex; align-items:center; justify-content:center;
-                    font-weight:700; font-size:0.85rem;
-                ">
-                    {_get_initials(user.get('name', 'U'))}
-                </div>
-                """,
+                _initials_avatar_html(_get_initials(user.get('name', 'U'))),
                 unsafe_allow_html=True,
             )
 
     with col_info:
         st.markdown(
-            f"""
-            <div style="padding-top:2px;">
-                <div style="font-weight:600; font-size:0.85rem; color:{theme.colors.text_primary};
-                            white-space:nowrap; overflow:hidden; text-overflow:ellipsis;">
-                    {user.get('name', 'User')}
-                </div>
-                <div style="font-size:0.75rem; color:{theme.colors.text_muted};
-                            white-space:nowrap; overflow:hidden; text-overflow:ellipsis;">
-                    {user.get('email', '')}
-                </div>
-            </div>
-            """,
+            _user_info_html(user.get('name', 'User'), user.get('email', '')),
             unsafe_allow_html=True,
         )
 
@@ -185,9 +193,20 @@ def render_page_header(
         description: Subtitle / description text.
         icon: Optional emoji icon.
     """
+    st.markdown(_page_header_html(title, description, icon), unsafe_allow_html=True)
+
+
+# ======================================================================
+# Helpers
+# ======================================================================
+# HTML builders are memoized on their inputs; theme colors are fixed per
+# process, so they don't need to be part of the key.
+
+@lru_cache(maxsize=128)
+def _page_header_html(title: str, description: str, icon: str) -> str:
+    """Build the page header HTML block."""
     header = f"{icon}  {title}" if icon else title
-    st.markdown(
-        f"""
+    return f"""
         <div style="margin-bottom:1.5rem;">
             <h1 style="margin:0 0 0.25rem; font-size:1.75rem; font-weight:700;
                        color:{theme.colors.text_primary};">
@@ -196,15 +215,42 @@ def render_page_header(
             {'<p style="margin:0; color:' + theme.colors.text_secondary + '; font-size:0.95rem;">'
              + description + '</p>' if description else ''}
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
 
 
-# ======================================================================
-# Helpers
-# ======================================================================
+@lru_cache(maxsize=256)
+def _initials_avatar_html(initials: str) -> str:
+    """Build the round initials avatar shown when there is no photo."""
+    return f"""
+                <div style="
+                    width:36px; height:36px; border-radius:50%;
+                    background:{theme.colors.primary}; color:white;
+                    display:flex; align-items:center; justify-content:center;
+                    font-weight:700; font-size:0.85rem;
+                ">
+                    {initials}
+                </div>
+                """
+
+
+@lru_cache(maxsize=256)
+def _user_info_html(name: str, email: str) -> str:
+    """Build the name + email block next to the avatar."""
+    return f"""
+            <div style="padding-top:2px;">
+                <div style="font-weight:600; font-size:0.85rem; color:{theme.colors.text_primary};
+                            white-space:nowrap; overflow:hidden; text-overflow:ellipsis;">
+                    {name}
+                </div>
+                <div style="font-size:0.75rem; color:{theme.colors.text_muted};
+                            white-space:nowrap; overflow:hidden; text-overflow:ellipsis;">
+                    {email}
+                </div>
+            </div>
+            """
+
 
+@lru_cache(maxsize=256)
 def _get_initials(name: str) -> str:
     """Extract up to 2 initials from a display name."""
     parts = name.strip().split()
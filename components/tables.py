@@ -23,7 +23,10 @@ from typing import Any, Literal
 
 import pandas as pd
 import streamlit as st
-from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode, JsCode
+
+# st_aggrid is imported inside the functions that use it: its package
+# import pulls in the component registration, which pages without a
+# table shouldn't pay for on cold start.
 
 
 @dataclass
@@ -93,7 +96,56 @@ def render_aggrid_table(
     else:
         search_term = ""
 
-    # --- Build grid options ---
+    from st_aggrid import AgGrid, DataReturnMode, GridUpdateMode
+
+    # --- Build grid options (cached per schema + config) ---
+    schema = tuple((str(c), str(t)) for c, t in df.dtypes.items())
+    # AgGrid only sets top-level keys, so a shallow copy keeps the cache intact.
+    grid_options = dict(_build_grid_options(schema, config))
+
+    # Apply quick filter
+    if search_term:
+        grid_options["quickFilterText"] = search_term
+
+    # --- Render ---
+    response = AgGrid(
+        df,
+        gridOptions=grid_options,
+        update_mode=GridUpdateMode.MODEL_CHANGED,
+        data_return_mode=DataReturnMode.FILTERED_AND_SORTED,
+        theme=config.theme,
+        height=config.height,
+        allow_unsafe_jscode=True,
+        key=key,
+    )
+
+    # --- Export button ---
+    if config.enable_export:
+        _render_export_button(response.data, key)
+
+    return response
+
+
+@st.cache_resource(
+    show_spinner=False,
+    max_entries=32,
+    hash_funcs={"st_aggrid.shared.JsCode": lambda js: js.js_code},
+)
+def _build_grid_options(
+    schema: tuple[tuple[str, str], ...],
+    config: AgGridConfig,
+) -> dict[str, Any]:
+    """
+    Build AgGrid options from the DataFrame schema and table config.
+    Column defs only depend on column names and dtypes, so an empty frame
+    with the same schema yields the same options as the full data.
+    JsCode values are resolved to their source here (as AgGrid would do
+    in place), so the cached dict is never mutated downstream.
+    """
+    from st_aggrid import GridOptionsBuilder, JsCode
+    from st_aggrid.shared import walk_gridOptions
+
+    df = pd.DataFrame({c: pd.Series(dtype=t) for c, t in schema})
     gb = GridOptionsBuilder.from_dataframe(df)
 
     # Default column settings
@@ -134,34 +186,14 @@ def render_aggrid_table(
         gb.configure_grid_options(domLayout="normal")
 
     grid_options = gb.build()
-
-    # Apply quick filter
-    if search_term:
-        grid_options["quickFilterText"] = search_term
-
-    # --- Render ---
-    response = AgGrid(
-        df,
-        gridOptions=grid_options,
-        update_mode=GridUpdateMode.MODEL_CHANGED,
-        data_return_mode=DataReturnMode.FILTERED_AND_SORTED,
-        theme=config.theme,
-        height=config.height,
-        allow_unsafe_jscode=True,
-        key=key,
-    )
-
-    # --- Export button ---
-    if config.enable_export:
-        _render_export_button(response.data, key)
-
-    return response
+    walk_gridOptions(grid_options, lambda v: v.js_code if isinstance(v, JsCode) else v)
+    return grid_options
 
 
 def _render_export_button(df: pd.DataFrame, key: str | None) -> None:
     """Render a CSV download button below the table."""
     if df is not None and not df.empty:
-        csv = df.to_csv(index=False).encode("utf-8")
+        csv = _df_to_csv_bytes(df)
         st.download_button(
             label="📥 Export CSV",
             data=csv,
@@ -169,3 +201,12 @@ def _render_export_button(df: pd.DataFrame, key: str | None) -> None:
             mime="text/csv",
             key=f"export_{key or 'default'}",
         )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to UTF-8 CSV bytes, cached per table content so
+    reruns don't re-encode an unchanged table.
+    """
+    return df.to_csv(index=False).encode("utf-8")
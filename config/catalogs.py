@@ -8,6 +8,7 @@ administrar desde la pantalla de Configuración (RF-004).
 
 Persistence: catálogos se guardan en ``config/catalogs.json``.
 Si el archivo no existe, se inicializa desde DEFAULT_IMPACT_CAUSE_CATALOG.
+Las escrituras se agrupan (debounce) y se vuelcan con ``flush_catalog()``.
 
 Referencia: specs/operation-events.md — Sección 11
 ============================================================================
@@ -15,9 +16,28 @@ Referencia: specs/operation-events.md — Sección 11
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
+import os
+import sys
+import threading
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TypeVar
+
+try:
+    import orjson
+except ImportError:  # optional — fall back to stdlib json
+    orjson = None
+
+__all__ = [
+    "DEFAULT_IMPACT_CAUSE_CATALOG",
+    "get_catalog", "get_impact_types", "get_causes_for_impact",
+    "add_impact_type", "rename_impact_type", "remove_impact_type",
+    "add_cause", "remove_cause", "rename_cause",
+    "reset_catalog", "flush_catalog",
+]
 
 
 # ======================================================================
@@ -32,8 +52,8 @@ _CATALOG_FILE = _CATALOG_DIR / "catalogs.json"
 # Catálogo por defecto: Tipo de Impacto → Lista de Causas
 # ======================================================================
 
-DEFAULT_IMPACT_CAUSE_CATALOG: dict[str, list[str]] = {
-    "Paro de Ensamble": [
+DEFAULT_IMPACT_CAUSE_CATALOG: dict[str, tuple[str, ...]] = {
+    "Paro de Ensamble": (
         "Falla de equipo",
         "Falta de material",
         "Material incorrecto",
@@ -46,8 +66,8 @@ DEFAULT_IMPACT_CAUSE_CATALOG: dict[str, list[str]] = {
         "Defecto detectado en Máquina",
         "Contención activa",
         "Cambio urgente de prioridad",
-    ],
-    "Retrabajo": [
+    ),
+    "Retrabajo": (
         "Defecto de material",
         "Especificación incorrecta",
         "Instrucción de trabajo no clara",
@@ -57,8 +77,8 @@ DEFAULT_IMPACT_CAUSE_CATALOG: dict[str, list[str]] = {
         "Cambio Eng no implementado",
         "Criterio de aceptación incorrecto",
         "Defecto de proveedor",
-    ],
-    "Mejora del Proceso": [
+    ),
+    "Mejora del Proceso": (
         "Tiempo ciclo alto",
         "Cuello de botella",
         "Alta tasa de defectos",
@@ -75,8 +95,8 @@ DEFAULT_IMPACT_CAUSE_CATALOG: dict[str, list[str]] = {
         "Registro manual",
         "Abasto ineficiente",
         "Inventario innecesario",
-    ],
-    "Falta de Material": [
+    ),
+    "Falta de Material": (
         "Error en MRP",
         "Demanda mayor al forecast",
         "Inventario incorrecto en sistema",
@@ -90,7 +110,14 @@ DEFAULT_IMPACT_CAUSE_CATALOG: dict[str, list[str]] = {
         "Rechazo de lote",
         "Cambio de PN sin stock",
         "Retraso en transporte",
-    ],
+    ),
+}
+
+# Interned so membership checks against interned user input can short-circuit
+# on identity; tuples keep the defaults immutable.
+DEFAULT_IMPACT_CAUSE_CATALOG = {
+    sys.intern(k): tuple(sys.intern(c) for c in v)
+    for k, v in DEFAULT_IMPACT_CAUSE_CATALOG.items()
 }
 
 
@@ -98,93 +125,225 @@ DEFAULT_IMPACT_CAUSE_CATALOG: dict[str, list[str]] = {
 # Runtime catalog (mutable copy used by the app)
 # ======================================================================
 
-_catalog: dict[str, list[str]] | None = None
+# Causes are stored as insertion-ordered sets (dict[str, None]) for O(1)
+# membership checks and removal; they are written to JSON as arrays.
+_catalog: dict[str, dict[str, None]] | None = None
+
+# Write-back persistence: CRUD calls mark the catalog dirty and a short
+# debounce timer coalesces bursts of edits into a single file write.
+# Mutators and the flush timer both hold _save_lock; it is re-entrant
+# because mutators call get_catalog() / _schedule_save() while holding it.
+_SAVE_DEBOUNCE_S = 0.15
+_save_lock = threading.RLock()
+_dirty = False
+_flush_timer: threading.Timer | None = None
+
+# Digest of the last payload this process wrote, plus the file's mtime right
+# after that write; identical re-saves of an untouched file are skipped.
+_last_saved: tuple[bytes, int] | None = None
+
+# Read-only views handed to the pages, rebuilt only after a mutation or
+# when get_catalog() switches to a freshly loaded catalog object.
+_views_source: dict[str, dict[str, None]] | None = None
+_impact_types_cache: tuple[str, ...] | None = None
+_causes_cache: dict[str, tuple[str, ...]] = {}
+
+
+@lru_cache(maxsize=1)
+def _load_catalogs_cached(mtime_ns: int) -> dict[str, dict[str, None]] | None:
+    """
+    Parse the catalog file once per modification time.
+    ``mtime_ns`` is only the cache key: any save (from this or another
+    process) bumps it, so the next call re-reads the file.
+    """
+    try:
+        data = _CATALOG_FILE.read_bytes()
+        raw = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (ValueError, OSError):  # JSONDecodeError subclasses ValueError
+        return None
+    return {sys.intern(k): dict.fromkeys(map(sys.intern, v)) for k, v in raw.items()}
 
 
-def _load_from_file() -> dict[str, list[str]] | None:
+def _load_from_file() -> dict[str, dict[str, None]] | None:
     """Load catalog from JSON file if it exists."""
-    if _CATALOG_FILE.exists():
-        try:
-            with open(_CATALOG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            return None
-    return None
+    try:
+        mtime_ns = _CATALOG_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _load_catalogs_cached(mtime_ns)
 
 
 def _save_to_file(catalog: dict[str, list[str]]) -> bool:
-    """Persist catalog to JSON file. Returns True on success."""
+    """
+    Persist catalog to JSON file atomically (tmp + rename). Returns True on success.
+    Callers must hold ``_save_lock``.
+    """
+    global _last_saved
+    if orjson is not None:
+        payload = orjson.dumps(catalog, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(catalog, ensure_ascii=False, indent=2).encode("utf-8")
+
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if _last_saved is not None and _last_saved[0] == digest:
+        try:
+            if _CATALOG_FILE.stat().st_mtime_ns == _last_saved[1]:
+                return True  # file still holds exactly this content
+        except OSError:
+            pass
+
+    tmp = _CATALOG_FILE.with_suffix(".json.tmp")
     try:
-        with open(_CATALOG_FILE, "w", encoding="utf-8") as f:
-            json.dump(catalog, f, ensure_ascii=False, indent=2)
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, _CATALOG_FILE)
+        _last_saved = (digest, _CATALOG_FILE.stat().st_mtime_ns)
         return True
     except OSError:
+        # Never leave a half-written temp file behind
+        tmp.unlink(missing_ok=True)
         return False
 
 
-def get_catalog() -> dict[str, list[str]]:
+def _schedule_save() -> None:
+    """Mark the runtime catalog dirty and (re)arm the debounced flush."""
+    global _dirty, _flush_timer
+    _invalidate_views()  # every mutator ends here
+    with _save_lock:
+        _dirty = True
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+        _flush_timer = threading.Timer(_SAVE_DEBOUNCE_S, flush_catalog)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def flush_catalog() -> bool:
+    """
+    Write any pending catalog edits to disk immediately.
+    Returns True if nothing was pending or the write succeeded.
+    """
+    global _dirty, _flush_timer
+    with _save_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _dirty or _catalog is None:
+            return True
+        snapshot = {k: list(v) for k, v in _catalog.items()}
+        ok = _save_to_file(snapshot)
+        _dirty = not ok
+        return ok
+
+
+atexit.register(flush_catalog)
+
+
+def get_catalog() -> dict[str, dict[str, None]]:
     """
-    Return the current impact→cause catalog.
-    Load order: runtime cache → JSON file → defaults.
+    Return the current impact→cause catalog (causes as ordered key sets).
+    Load order: runtime cache with unflushed edits → JSON file (parsed once
+    per mtime) → runtime cache → defaults.
     """
     global _catalog
-    if _catalog is None:
-        loaded = _load_from_file()
-        if loaded is not None:
-            _catalog = loaded
-        else:
-            _catalog = {k: list(v) for k, v in DEFAULT_IMPACT_CAUSE_CATALOG.items()}
-            _save_to_file(_catalog)
+    loaded = None if _dirty else _load_from_file()
+    if loaded is not None:
+        _catalog = loaded
+    elif _catalog is None:
+        _catalog = _catalog_from_defaults()
+        with _save_lock:
+            _save_to_file({k: list(v) for k, v in _catalog.items()})
     return _catalog
 
 
-def get_impact_types() -> list[str]:
-    """Return the list of available impact types."""
-    return list(get_catalog().keys())
+def _invalidate_views() -> None:
+    """Drop the memoized impact-type / cause tuples."""
+    global _views_source, _impact_types_cache
+    _views_source = None
+    _impact_types_cache = None
+    _causes_cache.clear()
+
+
+def _current_views_catalog() -> dict[str, dict[str, None]]:
+    """Return the catalog, resetting the memoized views if it was reloaded."""
+    global _views_source
+    catalog = get_catalog()
+    if catalog is not _views_source:
+        _invalidate_views()
+        _views_source = catalog
+    return catalog
 
 
-def get_causes_for_impact(impact_type: str) -> list[str]:
-    """Return the list of causes associated with a given impact type."""
-    return get_catalog().get(impact_type, [])
+def get_impact_types() -> tuple[str, ...]:
+    """Return the available impact types (memoized until the catalog changes)."""
+    global _impact_types_cache
+    catalog = _current_views_catalog()
+    if _impact_types_cache is None:
+        _impact_types_cache = tuple(catalog)
+    return _impact_types_cache
+
+
+def get_causes_for_impact(impact_type: str) -> tuple[str, ...]:
+    """Return the causes for an impact type (memoized until the catalog changes)."""
+    catalog = _current_views_catalog()
+    causes = _causes_cache.get(impact_type)
+    if causes is None:
+        causes = _causes_cache[impact_type] = tuple(catalog.get(impact_type, ()))
+    return causes
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _locked(func: _F) -> _F:
+    """Run a catalog mutator under ``_save_lock`` so flushes see a consistent catalog."""
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _save_lock:
+            return func(*args, **kwargs)
+    return wrapper  # type: ignore[return-value]
 
 
 # ======================================================================
 # CRUD — Impact Types
 # ======================================================================
 
+@_locked
 def add_impact_type(name: str) -> bool:
     """Add a new impact type with an empty cause list. Returns False if it already exists."""
+    name = sys.intern(name)
     catalog = get_catalog()
     if name in catalog:
         return False
-    catalog[name] = []
-    _save_to_file(catalog)
+    catalog[name] = {}
+    _schedule_save()
     return True
 
 
+@_locked
 def rename_impact_type(old_name: str, new_name: str) -> bool:
     """Rename an impact type, preserving its causes and order."""
+    new_name = sys.intern(new_name)
     catalog = get_catalog()
     if old_name not in catalog or new_name in catalog:
         return False
-    # Preserve order
-    new_catalog: dict[str, list[str]] = {}
-    for key, val in catalog.items():
-        if key == old_name:
-            new_catalog[new_name] = val
-        else:
-            new_catalog[key] = val
-    _catalog_replace(new_catalog)
+    # Single pass that keeps the renamed type in its original position
+    _catalog_replace({
+        (new_name if key == old_name else key): val for key, val in catalog.items()
+    })
     return True
 
 
+@_locked
 def remove_impact_type(name: str) -> bool:
     """Remove an impact type and all its causes."""
     catalog = get_catalog()
     if name not in catalog:
         return False
     del catalog[name]
-    _save_to_file(catalog)
+    _schedule_save()
     return True
 
 
@@ -192,39 +351,47 @@ def remove_impact_type(name: str) -> bool:
 # CRUD — Causes
 # ======================================================================
 
+@_locked
 def add_cause(impact_type: str, cause: str) -> bool:
     """Add a cause to an impact type. Returns False if duplicate or type not found."""
+    cause = sys.intern(cause)
     catalog = get_catalog()
     if impact_type not in catalog:
         return False
-    if cause in catalog[impact_type]:
+    causes = catalog[impact_type]
+    if cause in causes:
         return False
-    catalog[impact_type].append(cause)
-    _save_to_file(catalog)
+    causes[cause] = None
+    _schedule_save()
     return True
 
 
+@_locked
 def remove_cause(impact_type: str, cause: str) -> bool:
     """Remove a cause from an impact type."""
     catalog = get_catalog()
     if impact_type not in catalog or cause not in catalog[impact_type]:
         return False
-    catalog[impact_type].remove(cause)
-    _save_to_file(catalog)
+    del catalog[impact_type][cause]
+    _schedule_save()
     return True
 
 
+@_locked
 def rename_cause(impact_type: str, old_cause: str, new_cause: str) -> bool:
     """Rename a cause within an impact type."""
+    new_cause = sys.intern(new_cause)
     catalog = get_catalog()
     if impact_type not in catalog:
         return False
     causes = catalog[impact_type]
     if old_cause not in causes or new_cause in causes:
         return False
-    idx = causes.index(old_cause)
-    causes[idx] = new_cause
-    _save_to_file(catalog)
+    # Rebuild to keep the renamed cause in its original position
+    catalog[impact_type] = {
+        (new_cause if c == old_cause else c): None for c in causes
+    }
+    _schedule_save()
     return True
 
 
@@ -232,15 +399,22 @@ def rename_cause(impact_type: str, old_cause: str, new_cause: str) -> bool:
 # Utilities
 # ======================================================================
 
-def _catalog_replace(new_catalog: dict[str, list[str]]) -> None:
+def _catalog_from_defaults() -> dict[str, dict[str, None]]:
+    """Build a fresh mutable runtime catalog from the defaults."""
+    return {k: dict.fromkeys(v) for k, v in DEFAULT_IMPACT_CAUSE_CATALOG.items()}
+
+
+@_locked
+def _catalog_replace(new_catalog: dict[str, dict[str, None]]) -> None:
     """Replace the entire runtime catalog and persist."""
     global _catalog
     _catalog = new_catalog
-    _save_to_file(new_catalog)
+    _schedule_save()
 
 
+@_locked
 def reset_catalog() -> None:
     """Reset the runtime catalog to defaults and persist."""
     global _catalog
-    _catalog = {k: list(v) for k, v in DEFAULT_IMPACT_CAUSE_CATALOG.items()}
-    _save_to_file(_catalog)
+    _catalog = _catalog_from_defaults()
+    _schedule_save()
@@ -10,9 +10,10 @@ Use these constants in all pages and components for visual consistency.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorPalette:
     """Application color palette aligned with Microsoft Fluent Design."""
 
@@ -32,7 +33,7 @@ class ColorPalette:
     text_muted: str = "#9CA3AF"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChartColors:
     """Color sequences for charts and visualizations."""
 
@@ -49,7 +50,7 @@ class ChartColors:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Spacing:
     """Spacing constants for consistent layout."""
 
@@ -61,7 +62,7 @@ class Spacing:
     xxl: str = "3rem"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Theme:
     """Master theme object combining all design tokens."""
 
@@ -78,10 +79,12 @@ class Theme:
 theme = Theme()
 
 
+@lru_cache(maxsize=1)
 def get_custom_css() -> str:
     """
     Returns custom CSS to inject into the Streamlit app for enhanced styling.
     Call this once in your main app entry point via st.markdown(unsafe_allow_html=True).
+    The theme is frozen, so the string is built once per process.
     """
     return f"""
     <style>
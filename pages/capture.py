@@ -21,6 +21,7 @@ Referencia: specs/operation-events.md — RF-001
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Any
 
@@ -32,8 +33,18 @@ from components.navigation import render_page_header
 from config.catalogs import get_impact_types, get_causes_for_impact
 from config.settings import get_settings
 from config.theme import theme
-from utils.email import send_event_notification
-from utils.sharepoint import create_event
+
+
+# Static HTML fragments (theme is frozen, so these never change)
+_GRADIENT_DIVIDER_HTML = f"""
+        <div style="height:4px; border-radius:2px; margin-bottom:1.5rem;
+                    background: linear-gradient(90deg, {theme.colors.primary}, {theme.colors.primary_light});"></div>
+        """
+
+_FORM_CONTAINER_OPEN_HTML = f"""
+            <div style="background:{theme.colors.surface}; border:1px solid {theme.colors.border};
+                        border-radius:{theme.border_radius}; padding:0.5rem; margin-bottom:0.5rem;">
+            """
 
 
 def render() -> None:
@@ -43,28 +54,17 @@ def render() -> None:
         description="Registre un nuevo evento operativo detectado",
         icon="➕",
     )
+    _report_pending_email()
 
     # Gradient divider
-    st.markdown(
-        f"""
-        <div style="height:4px; border-radius:2px; margin-bottom:1.5rem;
-                    background: linear-gradient(90deg, {theme.colors.primary}, {theme.colors.primary_light});"></div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_GRADIENT_DIVIDER_HTML, unsafe_allow_html=True)
 
     settings = get_settings()
     domain = settings.user_domain
 
     # ── Form container ──────────────────────────────────────────────
     with st.container():
-        st.markdown(
-            f"""
-            <div style="background:{theme.colors.surface}; border:1px solid {theme.colors.border};
-                        border-radius:{theme.border_radius}; padding:0.5rem; margin-bottom:0.5rem;">
-            """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(_FORM_CONTAINER_OPEN_HTML, unsafe_allow_html=True)
 
         # Row 1: Persona que detecta | Tipo de Impacto
         col1, col2 = st.columns(2)
@@ -87,7 +87,7 @@ def render() -> None:
             impact_types = get_impact_types()
             tipo_impacto = st.selectbox(
                 label="Seleccione tipo de impacto...",
-                options=[""] + impact_types,
+                options=("", *impact_types),
                 key="capture_tipo_impacto",
                 label_visibility="visible",
             )
@@ -101,7 +101,7 @@ def render() -> None:
                 causas = get_causes_for_impact(tipo_impacto)
                 causa = st.selectbox(
                     "Seleccione causa...",
-                    options=[""] + causas,
+                    options=("", *causas),
                     key="capture_causa",
                     label_visibility="collapsed",
                 )
@@ -216,10 +216,47 @@ def render() -> None:
             )
 
 
+# ======================================================================
+# Background Notification
+# ======================================================================
+
+# Session key holding the Future of the notification sent on the last save
+PENDING_EMAIL_KEY = "pending_email"
+
+
+def _report_pending_email() -> None:
+    """Show the result of the notification sent on a previous save, once done."""
+    pending: Future[tuple[bool, str]] | None = st.session_state.get(PENDING_EMAIL_KEY)
+    if pending is None or not pending.done():
+        return
+    del st.session_state[PENDING_EMAIL_KEY]
+
+    try:
+        email_ok, email_msg = pending.result()
+    except Exception as e:
+        email_ok, email_msg = False, str(e)
+
+    if email_ok:
+        st.toast(f"📧 {email_msg}")
+    else:
+        st.toast(f"⚠️ Evento guardado pero no se pudo enviar email: {email_msg}")
+
+
 # ======================================================================
 # Validation
 # ======================================================================
 
+# Error for each required field, in the order checked by _validate_form
+_REQUIRED_FIELD_ERRORS: tuple[str, ...] = (
+    "**Persona que detecta hallazgo** es obligatorio.",
+    "**Tipo de Impacto** es obligatorio.",
+    "**Causa** es obligatoria.",
+    "**Número de Proyecto** es obligatorio.",
+    "**Número de Parte / Número de Plano** es obligatorio.",
+    "**Responsable** es obligatorio.",
+)
+
+
 def _validate_form(
     persona: dict[str, Any] | None,
     tipo_impacto: str,
@@ -229,22 +266,15 @@ def _validate_form(
     responsable: dict[str, Any] | None,
 ) -> list[str]:
     """Validate all required fields. Returns list of error messages."""
-    errors: list[str] = []
-
-    if not persona:
-        errors.append("**Persona que detecta hallazgo** es obligatorio.")
-    if not tipo_impacto:
-        errors.append("**Tipo de Impacto** es obligatorio.")
-    if not causa:
-        errors.append("**Causa** es obligatoria.")
-    if not numero_proyecto or not numero_proyecto.strip():
-        errors.append("**Número de Proyecto** es obligatorio.")
-    if not numero_parte or not numero_parte.strip():
-        errors.append("**Número de Parte / Número de Plano** es obligatorio.")
-    if not responsable:
-        errors.append("**Responsable** es obligatorio.")
-
-    return errors
+    present = (
+        persona,
+        tipo_impacto,
+        causa,
+        numero_proyecto and numero_proyecto.strip(),
+        numero_parte and numero_parte.strip(),
+        responsable,
+    )
+    return [msg for value, msg in zip(present, _REQUIRED_FIELD_ERRORS) if not value]
 
 
 # ======================================================================
@@ -262,6 +292,10 @@ def _save_event(
     fecha_hallazgo: datetime,
 ) -> None:
     """Save the event to Microsoft List and show confirmation."""
+    # Only needed on submit; keeps the page module light to import.
+    from utils.email import enqueue_event_notification
+    from utils.sharepoint import create_event
+
     persona_name = persona.get("name") or persona.get("displayName", "")
     responsable_name = responsable.get("displayName", "")
     responsable_email = responsable.get("mail") or responsable.get("userPrincipalName", "")
@@ -284,18 +318,15 @@ def _save_event(
     if item_id:
         st.success(f"✅ Evento registrado exitosamente (ID: {item_id}).")
 
-        # Send email notification to responsable
+        # Send email notification to responsable in the background; the
+        # outcome is reported on a later rerun by _report_pending_email.
         if responsable_email:
-            with st.spinner(f"Enviando notificación a {responsable_email}..."):
-                email_ok, email_msg = send_event_notification(
-                    event_data=event_data,
-                    recipient_email=responsable_email,
-                    recipient_name=responsable_name,
-                )
-            if email_ok:
-                st.success(f"📧 {email_msg}")
-            else:
-                st.warning(f"⚠️ Evento guardado pero no se pudo enviar email: {email_msg}")
+            st.session_state[PENDING_EMAIL_KEY] = enqueue_event_notification(
+                event_data=event_data,
+                recipient_email=responsable_email,
+                recipient_name=responsable_name,
+            )
+            st.info(f"📧 Enviando notificación a {responsable_email}...")
         else:
             st.warning("⚠️ Evento guardado pero no se encontró email del responsable.")
 
@@ -27,7 +27,12 @@ from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
 from components.navigation import render_page_header
 from config.settings import get_settings
 from config.theme import theme
-from utils.sharepoint import get_all_events, update_event
+from utils.sharepoint import (
+    SharePointReadError,
+    get_all_events_cached,
+    invalidate_events_cache,
+    update_events_batch,
+)
 
 
 # ======================================================================
@@ -54,30 +59,34 @@ COLUMN_CONFIG = [
     ("status",            "Status",                True,  110),
 ]
 
+# Derived once from COLUMN_CONFIG
+COL_ORDER: tuple[str, ...] = tuple(key for key, _, _, _ in COLUMN_CONFIG)
+EDITABLE_KEYS: tuple[str, ...] = tuple(key for key, _, editable, _ in COLUMN_CONFIG if editable)
+DATE_KEYS = frozenset({"fecha_hallazgo", "fecha_plan", "fecha_real_cierre"})
+
+# Above this many filtered rows the grid is fed one page at a time
+GRID_PAGE_ROWS = 500
+
 
 # ======================================================================
 # Data Loading
 # ======================================================================
 
-def _load_events() -> pd.DataFrame:
-    """Fetch events from SharePoint and return as DataFrame."""
-    events = get_all_events()
+def _load_events() -> pd.DataFrame | None:
+    """
+    Fetch events from SharePoint and return as DataFrame, or None (after
+    showing the error) when the read failed.
+    """
+    try:
+        events = get_all_events_cached()
+    except SharePointReadError as e:
+        st.error(str(e))
+        return None
     if not events:
         return pd.DataFrame()
 
-    df = pd.DataFrame(events)
-
-    # Ensure all expected columns exist
-    for key, _, _, _ in COLUMN_CONFIG:
-        if key not in df.columns:
-            df[key] = ""
-
-    # Order columns
-    col_order = [c[0] for c in COLUMN_CONFIG]
-    existing = [c for c in col_order if c in df.columns]
-    df = df[existing]
-
-    return df
+    # Keep the configured columns in order, adding any missing ones as ""
+    return pd.DataFrame(events).reindex(columns=COL_ORDER, fill_value="")
 
 
 # ======================================================================
@@ -99,8 +108,9 @@ def _build_grid_options(df: pd.DataFrame) -> dict:
     )
 
     # Configure each column
+    df_cols = set(df.columns)
     for key, label, editable, width in COLUMN_CONFIG:
-        if key not in df.columns:
+        if key not in df_cols:
             continue
 
         col_opts: dict[str, Any] = {
@@ -115,7 +125,7 @@ def _build_grid_options(df: pd.DataFrame) -> dict:
             col_opts["cellEditorParams"] = {"values": STATUS_OPTIONS}
 
         # Date columns: format nicely
-        if key in ("fecha_hallazgo", "fecha_plan", "fecha_real_cierre"):
+        if key in DATE_KEYS:
             col_opts["type"] = ["dateColumnFilter"]
 
         # Comentarios: multiline wrap
@@ -153,55 +163,70 @@ def _build_grid_options(df: pd.DataFrame) -> dict:
 # Save Changes
 # ======================================================================
 
-def _save_changes(original_df: pd.DataFrame, edited_df: pd.DataFrame) -> int:
+def _normalize_editable(df: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """Index rows by item ID and coerce editable columns to stripped strings."""
+    ids = df["id"].astype(str)
+    has_id = (ids != "").to_numpy()
+    out = df.reindex(columns=keys)[has_id].set_axis(ids[has_id], axis=0)
+    out = out[~out.index.duplicated(keep="last")]
+    return out.fillna("").astype(str).apply(lambda col: col.str.strip())
+
+
+def _diff_editable(
+    original_df: pd.DataFrame,
+    edited_df: pd.DataFrame,
+) -> dict[str, dict[str, Any]]:
     """
-    Compare original and edited DataFrames, save changes to SharePoint.
+    Compare the editable cells of two DataFrames by item ID.
 
     Returns:
-        Number of rows successfully updated.
+        Mapping of item ID → {column: new value} for rows that differ,
+        with blank values as None.
     """
-    editable_keys = [key for key, _, editable, _ in COLUMN_CONFIG if editable]
-    updated_count = 0
-
-    # Build lookup of original rows by item ID
-    orig_by_id: dict[str, dict[str, Any]] = {}
-    for _, row in original_df.iterrows():
-        rid = str(row.get("id", ""))
-        if rid:
-            orig_by_id[rid] = row.to_dict()
-
-    for _, edited_row in edited_df.iterrows():
-        row_id = str(edited_row.get("id", ""))
-        if not row_id or row_id not in orig_by_id:
-            continue
+    editable_keys = [key for key in EDITABLE_KEYS if key in edited_df.columns]
 
-        orig_row = orig_by_id[row_id]
-        changes: dict[str, Any] = {}
+    # Align both frames on item ID and diff the editable cells in one pass
+    edited = _normalize_editable(edited_df, editable_keys)
+    orig = _normalize_editable(original_df, editable_keys)
+    edited = edited[edited.index.isin(orig.index)]
+    mask = edited.ne(orig.reindex(edited.index))
 
-        for key in editable_keys:
-            if key not in edited_df.columns:
-                continue
-            new_val = edited_row.get(key)
-            old_val = orig_row.get(key)
+    return {
+        row_id: {key: val or None for key, val in edited.loc[row_id, mask.loc[row_id]].items()}
+        for row_id in edited.index[mask.any(axis=1)]
+    }
 
-            # Normalize NaN/None
-            if pd.isna(new_val) if not isinstance(new_val, str) else False:
-                new_val = ""
-            if pd.isna(old_val) if not isinstance(old_val, str) else False:
-                old_val = ""
 
-            new_str = str(new_val).strip() if new_val is not None else ""
-            old_str = str(old_val).strip() if old_val is not None else ""
-
-            if new_str != old_str:
-                changes[key] = new_str if new_str else None
+def _save_changes(
+    original_df: pd.DataFrame,
+    edited_df: pd.DataFrame,
+) -> dict[str, dict[str, Any]]:
+    """
+    Compare original and edited DataFrames, save changes to SharePoint.
 
-        if changes:
-            success = update_event(row_id, changes)
-            if success:
-                updated_count += 1
+    Only cells that differ from the fetched baseline are sent, so editing a
+    cell twice before saving uploads just the final value.
 
-    return updated_count
+    Returns:
+        Mapping of item ID → changes for the rows successfully updated.
+    """
+    pending = _diff_editable(original_df, edited_df)
+
+    # One Graph $batch call per 20 edited rows
+    return {row_id: pending[row_id] for row_id in update_events_batch(pending)}
+
+
+def _apply_changes(df: pd.DataFrame, changes_by_id: dict[str, dict[str, Any]]) -> pd.DataFrame:
+    """Return a copy of ``df`` with the given edits written into the matching rows."""
+    df = df.copy()
+    ids = df["id"].astype(str)
+    for key in {key for changes in changes_by_id.values() for key in changes}:
+        df[key] = df[key].astype(object)
+    for row_id, changes in changes_by_id.items():
+        row_mask = ids == row_id
+        for key, value in changes.items():
+            df.loc[row_mask, key] = value
+    return df
 
 
 # ======================================================================
@@ -226,11 +251,16 @@ def render() -> None:
         save = st.button("💾 Guardar Cambios", key="save_events", type="primary")
 
     # --- Load Data ---
+    if refresh:
+        invalidate_events_cache()
+
     if refresh or "events_df" not in st.session_state:
         with st.spinner("Cargando eventos desde SharePoint..."):
             df = _load_events()
-            st.session_state["events_df"] = df
-            st.session_state["events_df_original"] = df.copy()
+        if df is None:
+            return  # not stored, so the next rerun tries again
+        st.session_state["events_df"] = df
+        st.session_state["events_df_original"] = df.copy()
 
     df = st.session_state.get("events_df", pd.DataFrame())
 
@@ -266,22 +296,23 @@ def render() -> None:
             key="filter_impacto",
         )
 
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters as one composite mask
+    mask = pd.Series(True, index=df.index)
     if selected_resp != "Todos":
-        filtered_df = filtered_df[filtered_df["responsable"] == selected_resp]
+        mask &= df["responsable"] == selected_resp
     if selected_status != "Todos":
-        filtered_df = filtered_df[filtered_df["status"] == selected_status]
+        mask &= df["status"] == selected_status
     if selected_impacto != "Todos":
-        filtered_df = filtered_df[filtered_df["tipo_impacto"] == selected_impacto]
+        mask &= df["tipo_impacto"] == selected_impacto
 
-    filtered_df = filtered_df.reset_index(drop=True)
+    filtered_df = df.loc[mask].reset_index(drop=True)
 
     # --- Summary Metrics ---
     total = len(filtered_df)
-    open_count = len(filtered_df[filtered_df["status"] == "Open"]) if "status" in filtered_df.columns else 0
-    in_progress = len(filtered_df[filtered_df["status"] == "In Progress"]) if "status" in filtered_df.columns else 0
-    closed = len(filtered_df[filtered_df["status"] == "Closed"]) if "status" in filtered_df.columns else 0
+    status_counts = filtered_df["status"].value_counts() if "status" in filtered_df.columns else pd.Series(dtype="int64")
+    open_count = int(status_counts.get("Open", 0))
+    in_progress = int(status_counts.get("In Progress", 0))
+    closed = int(status_counts.get("Closed", 0))
 
     m1, m2, m3, m4 = st.columns(4)
     m1.metric("Total Eventos", total)
@@ -300,33 +331,52 @@ def render() -> None:
         unsafe_allow_html=True,
     )
 
-    grid_options = _build_grid_options(filtered_df)
+    # Large lists are sent to the browser one page at a time
+    grid_df = filtered_df
+    if len(filtered_df) > GRID_PAGE_ROWS:
+        page_count = -(-len(filtered_df) // GRID_PAGE_ROWS)
+        page = st.number_input(
+            f"Página (de {page_count})",
+            min_value=1,
+            max_value=page_count,
+            value=1,
+            step=1,
+            key="events_grid_page",
+        )
+        start = (int(page) - 1) * GRID_PAGE_ROWS
+        grid_df = filtered_df.iloc[start:start + GRID_PAGE_ROWS].reset_index(drop=True)
+
+    grid_options = _build_grid_options(grid_df)
 
     grid_response = AgGrid(
-        filtered_df,
+        grid_df,
         gridOptions=grid_options,
         update_mode=GridUpdateMode.VALUE_CHANGED,
         data_return_mode=DataReturnMode.AS_INPUT,
         fit_columns_on_grid_load=False,
-        height=min(400 + len(filtered_df) * 10, 700),
+        height=min(400 + len(grid_df) * 10, 700),
         theme="streamlit",
         allow_unsafe_jscode=False,
     )
 
+    # Fold edits made on this page into the working copy, so edits on other
+    # pages survive page switches and are all saved together.
+    edited_page = grid_response["data"]
+    if isinstance(edited_page, pd.DataFrame) and not edited_page.empty:
+        page_edits = _diff_editable(grid_df, edited_page)
+        if page_edits:
+            df = _apply_changes(df, page_edits)
+            st.session_state["events_df"] = df
+
     # --- Save Logic ---
     if save:
-        edited_data = grid_response["data"]
-        if isinstance(edited_data, pd.DataFrame) and not edited_data.empty:
-            original = st.session_state.get("events_df_original", pd.DataFrame())
-            with st.spinner("Guardando cambios en SharePoint..."):
-                count = _save_changes(original, edited_data)
-            if count > 0:
-                st.success(f"✅ {count} evento(s) actualizado(s) exitosamente.")
-                # Refresh data
-                st.session_state.pop("events_df", None)
-                st.session_state.pop("events_df_original", None)
-                st.rerun()
-            else:
-                st.info("ℹ️ No se detectaron cambios para guardar.")
+        original = st.session_state.get("events_df_original", pd.DataFrame())
+        with st.spinner("Guardando cambios en SharePoint..."):
+            saved = _save_changes(original, df)
+        if saved:
+            # Advance the baseline for the saved rows only, instead of
+            # reloading the whole list from SharePoint.
+            st.session_state["events_df_original"] = _apply_changes(original, saved)
+            st.success(f"✅ {len(saved)} evento(s) actualizado(s) exitosamente.")
         else:
-            st.info("ℹ️ No hay datos para guardar.")
+            st.info("ℹ️ No se detectaron cambios para guardar.")
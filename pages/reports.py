@@ -17,65 +17,210 @@ Referencia: specs/operation-events.md — RF-003, Milestone 4
 
 from __future__ import annotations
 
+import os
+import tempfile
+import time
+from datetime import date
 from io import BytesIO
-from typing import Any
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
 from components.navigation import render_page_header
+from config.settings import get_settings
 from config.theme import theme
-from utils.sharepoint import get_all_events
+from utils.sharepoint import (
+    EVENTS_CACHE_TTL_S,
+    SharePointReadError,
+    get_all_events_cached,
+    invalidate_events_cache,
+    on_events_changed,
+)
 
 
 # ======================================================================
 # Data Loading
 # ======================================================================
 
+STATUS_ORDER = ("Open", "In Progress", "Closed")
+
+
+def _report_spill_path() -> Path:
+    """Local Parquet copy of the report data, one per SharePoint list."""
+    s = get_settings()
+    return Path(tempfile.gettempdir()) / f"events_{s.sharepoint_list_id}.parquet"
+
+
+@st.cache_data(ttl=EVENTS_CACHE_TTL_S, show_spinner="Cargando datos desde SharePoint...")
 def _load_report_data() -> pd.DataFrame:
-    """Fetch events from SharePoint and prepare for reporting."""
-    events = get_all_events()
-    if not events:
+    """
+    Fetch events from SharePoint and prepare for reporting. A failed read
+    raises SharePointReadError, so it is neither cached nor spilled.
+
+    The prepared frame is also spilled to Parquet so other app processes
+    (and restarts) within EVENTS_CACHE_TTL_S load it from disk instead of
+    paging through SharePoint again.
+    """
+    path = _report_spill_path()
+    try:
+        if time.time() - path.stat().st_mtime < EVENTS_CACHE_TTL_S:
+            return pd.read_parquet(path)
+    except Exception:
+        pass  # missing, stale or unreadable — fetch below
+
+    events = get_all_events_cached(as_dataframe=True)
+    if events.empty:
         return pd.DataFrame()
+    df = _prepare_report_df(events)
+
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp, compression="zstd", index=False)
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)  # the spill is only an optimization
+    return df
 
-    df = pd.DataFrame(events)
 
-    # Parse fecha_hallazgo to datetime
+@on_events_changed
+def _invalidate_report_data() -> None:
+    """Drop the cached and spilled report frame so writes show up at once."""
+    _load_report_data.clear()
+    _report_spill_path().unlink(missing_ok=True)
+
+
+def _prepare_report_df(events: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the report DataFrame from the fetched events frame. Only called
+    from the cached _load_report_data, so it needs no cache of its own.
+    """
+    df = events.copy()
+
+    # Parse date columns once at ingest. SharePoint returns ISO-8601 UTC; a
+    # fixed format skips per-element inference, and the columns are kept as
+    # naive UTC from here on so filters and deltas never touch timezones.
+    for col in ("fecha_hallazgo", "fecha_real_cierre"):
+        if col in df.columns:
+            fecha = df[col]
+            if not pd.api.types.is_datetime64_any_dtype(fecha):
+                fecha = pd.to_datetime(fecha, format="ISO8601", utc=True, errors="coerce")
+            if fecha.dt.tz is not None:
+                fecha = fecha.dt.tz_convert(None)
+            df[col] = fecha
+
+    # Month buckets stay numeric (datetime64[M]); only the distinct months
+    # are formatted as "YYYY-MM" labels. Undated rows get no month.
     if "fecha_hallazgo" in df.columns:
-        df["fecha_hallazgo"] = pd.to_datetime(df["fecha_hallazgo"], errors="coerce")
-        df["mes"] = df["fecha_hallazgo"].dt.tz_localize(None).dt.to_period("M").astype(str)
+        mes = pd.Series(
+            df["fecha_hallazgo"].to_numpy().astype("datetime64[M]"), index=df.index,
+        ).astype("category")
+        df["mes"] = mes.cat.rename_categories(mes.cat.categories.strftime("%Y-%m"))
 
-    # Fill NaN for grouping columns
+    # Fill NaN for grouping columns; they are low-cardinality, so categoricals
+    # make groupby/value_counts cheaper and shrink the frame
     for col in ("causa", "tipo_impacto", "numero_proyecto", "responsable", "status"):
         if col in df.columns:
-            df[col] = df[col].fillna("Sin dato")
+            df[col] = df[col].fillna("Sin dato").astype("category")
+
+    # Known statuses first, in workflow order, then anything unexpected
+    if "status" in df.columns:
+        extra = [s for s in df["status"].cat.categories if s not in STATUS_ORDER]
+        df["status"] = df["status"].cat.set_categories([*STATUS_ORDER, *extra])
 
     return df
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _filter_report_df(
+    df: pd.DataFrame,
+    fecha_inicio: date | None,
+    fecha_fin: date | None,
+    proyecto: str,
+    status: str,
+) -> pd.DataFrame:
+    """Apply the page filters as one composite mask; cached per filter combination."""
+    # Plain NumPy booleans: no index alignment on each &=. fecha_hallazgo
+    # is already naive UTC (see _prepare_report_df).
+    mask = np.ones(len(df), dtype=bool)
+    if fecha_inicio and "fecha_hallazgo" in df.columns:
+        mask &= (df["fecha_hallazgo"] >= pd.Timestamp(fecha_inicio)).to_numpy()
+    if fecha_fin and "fecha_hallazgo" in df.columns:
+        mask &= (df["fecha_hallazgo"] <= pd.Timestamp(fecha_fin) + pd.Timedelta(days=1)).to_numpy()
+    if proyecto != "Todos" and "numero_proyecto" in df.columns:
+        mask &= (df["numero_proyecto"] == proyecto).to_numpy()
+    if status != "Todos" and "status" in df.columns:
+        mask &= (df["status"] == status).to_numpy()
+
+    filtered = df.loc[mask].reset_index(drop=True)
+    # Drop categories the filters emptied so value_counts doesn't list them
+    cat_cols = filtered.select_dtypes("category").columns
+    filtered[cat_cols] = filtered[cat_cols].apply(lambda col: col.cat.remove_unused_categories())
+    return filtered
+
+
+# ======================================================================
+# Chart Aggregates
+# ======================================================================
+
+# Category charts show at most this many bars; in a Pareto the first ~20
+# categories carry nearly all of the volume.
+_CHART_TOP_N = 20
+
+def _count_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """value_counts of a column, or an empty Series if it is missing."""
+    if column not in df.columns:
+        return pd.Series(dtype="int64")
+    return df[column].value_counts()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _compute_chart_aggregates(df: pd.DataFrame) -> dict[str, pd.Series]:
+    """
+    All chart, metric and insight inputs, rolled up in one place from the
+    filtered frame. The rollups are tiny, so caching them is cheap.
+    """
+    has_mes = "mes" in df.columns
+    return {
+        "tipo_impacto": _count_column(df, "tipo_impacto"),
+        "causa": _count_column(df, "causa"),
+        "numero_proyecto": _count_column(df, "numero_proyecto"),
+        "status": _count_column(df, "status"),
+        "mes_impacto": (
+            df.groupby(["mes", "tipo_impacto"], observed=True).size()
+            if has_mes and "tipo_impacto" in df.columns else pd.Series(dtype="int64")
+        ),
+        "mes": df.groupby("mes", observed=True).size() if has_mes else pd.Series(dtype="int64"),
+    }
+
+
 # ======================================================================
 # Pareto Chart
 # ======================================================================
 
 def _render_pareto(
-    df: pd.DataFrame,
-    column: str = "causa",
+    value_counts: pd.Series,
     title: str = "Pareto de Causas",
     bar_color: str = "#0078D4",
 ) -> None:
-    """Render a generic Pareto chart for any categorical column."""
-    if column not in df.columns or df.empty:
+    """Render a generic Pareto chart from pre-computed category counts."""
+    if value_counts.empty:
         st.info(f"No hay datos para {title}.")
         return
 
-    counts = df[column].value_counts().reset_index()
-    counts.columns = ["Categoría", "Cantidad"]
-    counts = counts.sort_values("Cantidad", ascending=False).reset_index(drop=True)
-
-    total = counts["Cantidad"].sum()
-    counts["Acumulado"] = counts["Cantidad"].cumsum()
-    counts["% Acumulado"] = (counts["Acumulado"] / total * 100).round(1)
+    # value_counts is already sorted by descending count. Cumulative % is
+    # taken over every category in one NumPy pass, then only the top bars
+    # are turned into a frame.
+    values = value_counts.to_numpy()
+    cum_pct = np.cumsum(values)[:_CHART_TOP_N] / values.sum() * 100
+    counts = pd.DataFrame({
+        "Categoría": value_counts.index[:_CHART_TOP_N],
+        "Cantidad": values[:_CHART_TOP_N],
+        "% Acumulado": cum_pct.round(1),
+    })
 
     fig = go.Figure()
 
@@ -96,7 +241,7 @@ def _render_pareto(
         mode="lines+markers+text",
         line=dict(color="#D13438", width=2),
         marker=dict(size=6),
-        text=counts["% Acumulado"].apply(lambda v: f"{v}%"),
+        texttemplate="%{y}%",
         textposition="top center",
         textfont=dict(size=10),
     ))
@@ -124,15 +269,14 @@ def _render_pareto(
 # Events by Project Chart
 # ======================================================================
 
-def _render_events_by_project(df: pd.DataFrame) -> None:
+def _render_events_by_project(value_counts: pd.Series) -> None:
     """Render horizontal bar chart of events per project."""
-    if "numero_proyecto" not in df.columns or df.empty:
+    if value_counts.empty:
         st.info("No hay datos de proyectos.")
         return
 
-    counts = df["numero_proyecto"].value_counts().reset_index()
-    counts.columns = ["Proyecto", "Cantidad"]
-    counts = counts.sort_values("Cantidad", ascending=True)  # ascending for horizontal
+    counts = value_counts.head(_CHART_TOP_N).rename_axis("Proyecto").reset_index(name="Cantidad")
+    counts = counts.iloc[::-1]  # ascending for horizontal
 
     fig = go.Figure()
     fig.add_trace(go.Bar(
@@ -159,14 +303,13 @@ def _render_events_by_project(df: pd.DataFrame) -> None:
 # Monthly Trend Chart
 # ======================================================================
 
-def _render_trend(df: pd.DataFrame) -> None:
-    """Render monthly trend chart."""
-    if "mes" not in df.columns or df.empty:
+def _render_trend(by_mes_impacto: pd.Series, by_mes: pd.Series) -> None:
+    """Render monthly trend chart from counts per (month, impact) and per month."""
+    if by_mes.empty:
         st.info("No hay datos para el gráfico de tendencia.")
         return
 
-    # Count by month and impact type
-    trend = df.groupby(["mes", "tipo_impacto"]).size().reset_index(name="Cantidad")
+    trend = by_mes_impacto.reset_index(name="Cantidad")
 
     # Color map for impact types
     color_map = {
@@ -176,21 +319,23 @@ def _render_trend(df: pd.DataFrame) -> None:
         "Falta de Material": "#8764B8",
     }
 
-    fig = go.Figure()
-
-    for impacto in trend["tipo_impacto"].unique():
-        subset = trend[trend["tipo_impacto"] == impacto].sort_values("mes")
-        fig.add_trace(go.Scatter(
-            x=subset["mes"],
-            y=subset["Cantidad"],
-            name=impacto,
-            mode="lines+markers",
-            line=dict(color=color_map.get(impacto, "#666"), width=2),
-            marker=dict(size=7),
-        ))
+    # One px.line call builds every impact trace; the groupby output is
+    # already ordered by month, so no per-trace sort is needed.
+    fig = px.line(
+        trend,
+        x="mes",
+        y="Cantidad",
+        color="tipo_impacto",
+        color_discrete_map={
+            impacto: color_map.get(impacto, "#666")
+            for impacto in trend["tipo_impacto"].unique()
+        },
+        markers=True,
+    )
+    fig.update_traces(line_width=2, marker_size=7)
 
     # Also add total line
-    total_trend = df.groupby("mes").size().reset_index(name="Cantidad").sort_values("mes")
+    total_trend = by_mes.reset_index(name="Cantidad")
     fig.add_trace(go.Scatter(
         x=total_trend["mes"],
         y=total_trend["Cantidad"],
@@ -204,7 +349,7 @@ def _render_trend(df: pd.DataFrame) -> None:
         title="Tendencia Mensual de Eventos",
         xaxis_title="Mes",
         yaxis_title="Cantidad de Eventos",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, title_text=""),
         margin=dict(t=60, b=60),
         height=400,
     )
@@ -216,13 +361,18 @@ def _render_trend(df: pd.DataFrame) -> None:
 # Insights
 # ======================================================================
 
-def _render_insights(df: pd.DataFrame) -> None:
-    """Render insights section."""
-    if df.empty:
+def _render_insights(aggregates: dict[str, pd.Series], total: int) -> None:
+    """Render insights section from the pre-computed chart aggregates."""
+    if total == 0:
         return
 
     st.subheader("💡 Insights")
 
+    causa_vc = aggregates["causa"]
+    proj_vc = aggregates["numero_proyecto"]
+    status_vc = aggregates["status"]
+    impacto_vc = aggregates["tipo_impacto"]
+
     col1, col2, col3 = st.columns(3)
 
     # Top 3 causas
@@ -233,10 +383,9 @@ def _render_insights(df: pd.DataFrame) -> None:
             <h4 style="margin:0 0 0.5rem;">🔥 Top 3 Causas</h4>
         """, unsafe_allow_html=True)
 
-        if "causa" in df.columns:
-            top_causas = df["causa"].value_counts().head(3)
-            for i, (causa, count) in enumerate(top_causas.items(), 1):
-                pct = round(count / len(df) * 100, 1)
+        if not causa_vc.empty:
+            for i, (causa, count) in enumerate(causa_vc.head(3).items(), 1):
+                pct = round(count / total * 100, 1)
                 st.markdown(f"**{i}. {causa}** — {count} eventos ({pct}%)")
         st.markdown("</div>", unsafe_allow_html=True)
 
@@ -248,9 +397,8 @@ def _render_insights(df: pd.DataFrame) -> None:
             <h4 style="margin:0 0 0.5rem;">📁 Top 3 Proyectos</h4>
         """, unsafe_allow_html=True)
 
-        if "numero_proyecto" in df.columns:
-            top_proj = df["numero_proyecto"].value_counts().head(3)
-            for i, (proj, count) in enumerate(top_proj.items(), 1):
+        if not proj_vc.empty:
+            for i, (proj, count) in enumerate(proj_vc.nlargest(3).items(), 1):
                 st.markdown(f"**{i}. {proj}** — {count} eventos")
         st.markdown("</div>", unsafe_allow_html=True)
 
@@ -262,10 +410,8 @@ def _render_insights(df: pd.DataFrame) -> None:
             <h4 style="margin:0 0 0.5rem;">📊 Resumen de Status</h4>
         """, unsafe_allow_html=True)
 
-        if "status" in df.columns:
-            status_counts = df["status"].value_counts()
-            total = len(df)
-            for status, count in status_counts.items():
+        if not status_vc.empty:
+            for status, count in status_vc.items():
                 pct = round(count / total * 100, 1)
                 icon = {"Open": "🔴", "In Progress": "🟡", "Closed": "🟢"}.get(status, "⚪")
                 st.markdown(f"{icon} **{status}** — {count} ({pct}%)")
@@ -278,18 +424,17 @@ def _render_insights(df: pd.DataFrame) -> None:
         <h4 style="margin:0 0 0.5rem;">📋 Recomendaciones</h4>
     """, unsafe_allow_html=True)
 
-    if "causa" in df.columns and "status" in df.columns:
-        top_causa = df["causa"].value_counts().idxmax() if not df["causa"].value_counts().empty else None
-        open_count = len(df[df["status"] == "Open"])
-        total = len(df)
+    if not causa_vc.empty and not status_vc.empty:
+        top_causa = causa_vc.index[0] if not causa_vc.empty else None
+        open_count = int(status_vc.get("Open", 0))
 
         if top_causa:
-            causa_count = df["causa"].value_counts().iloc[0]
+            causa_count = causa_vc.iloc[0]
             st.markdown(f"- **Causa principal:** *{top_causa}* representa **{round(causa_count/total*100, 1)}%** de los eventos. Considerar plan de acción específico.")
         if open_count > 0:
             st.markdown(f"- **Eventos abiertos:** Hay **{open_count}** eventos sin cerrar ({round(open_count/total*100, 1)}%). Priorizar seguimiento.")
-        if "tipo_impacto" in df.columns:
-            paros = len(df[df["tipo_impacto"] == "Paro de Ensamble"])
+        if not impacto_vc.empty:
+            paros = int(impacto_vc.get("Paro de Ensamble", 0))
             if paros > 0:
                 st.markdown(f"- **Paros de Ensamble:** Se han registrado **{paros}** paros. Impacto directo en producción.")
 
@@ -300,17 +445,14 @@ def _render_insights(df: pd.DataFrame) -> None:
 # Excel Export
 # ======================================================================
 
+@st.cache_data(show_spinner=False, max_entries=4)
 def _export_excel(df: pd.DataFrame) -> bytes:
     """Export DataFrame to Excel bytes."""
     output = BytesIO()
 
     with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        # Main data sheet
-        export_df = df.copy()
-        # Strip timezone info (Excel doesn't support tz-aware datetimes)
-        for col in export_df.select_dtypes(include=["datetimetz"]).columns:
-            export_df[col] = export_df[col].dt.tz_localize(None)
-        # Rename columns for readability
+        # Main data sheet — rename without an upfront df.copy(); only the
+        # tz-aware columns get new arrays below.
         rename_map = {
             "id": "ID",
             "persona_detecta": "Detectó",
@@ -327,19 +469,21 @@ def _export_excel(df: pd.DataFrame) -> bytes:
             "fecha_real_cierre": "Fecha Real Cierre",
             "status": "Status",
         }
-        export_df = export_df.rename(columns=rename_map)
+        export_df = df.rename(columns=rename_map)
+        # Strip timezone info (Excel doesn't support tz-aware datetimes)
+        for col in export_df.select_dtypes(include=["datetimetz"]).columns:
+            export_df[col] = export_df[col].dt.tz_localize(None)
         export_df.to_excel(writer, sheet_name="Eventos", index=False)
 
-        # Summary sheet
-        if "Causa" in export_df.columns:
-            summary = export_df["Causa"].value_counts().reset_index()
-            summary.columns = ["Causa", "Cantidad"]
-            summary.to_excel(writer, sheet_name="Resumen Causas", index=False)
-
-        if "Tipo de Impacto" in export_df.columns:
-            impact_summary = export_df["Tipo de Impacto"].value_counts().reset_index()
-            impact_summary.columns = ["Tipo de Impacto", "Cantidad"]
-            impact_summary.to_excel(writer, sheet_name="Resumen Impacto", index=False)
+        # Summary sheets
+        for column, sheet_name in (("Causa", "Resumen Causas"), ("Tipo de Impacto", "Resumen Impacto")):
+            if column in export_df.columns:
+                (
+                    export_df[column].value_counts()
+                    .rename_axis(column)
+                    .reset_index(name="Cantidad")
+                    .to_excel(writer, sheet_name=sheet_name, index=False)
+                )
 
         # Auto-fit columns
         for sheet_name in writer.sheets:
@@ -360,7 +504,15 @@ def render() -> None:
         description="Análisis gráfico de eventos operativos",
         icon="📊",
     )
+    _render_report_body()
+
 
+@st.fragment
+def _render_report_body() -> None:
+    """
+    Toolbar, filters, charts and insights. Runs as a fragment so filter
+    changes rerun only this body, not the whole app script.
+    """
     # --- Toolbar ---
     col_refresh, col_export, col_spacer = st.columns([1, 1, 4])
 
@@ -368,12 +520,14 @@ def render() -> None:
         refresh = st.button("🔄 Actualizar Datos", key="refresh_reports", type="secondary")
 
     # --- Load Data ---
-    if refresh or "report_df" not in st.session_state:
-        with st.spinner("Cargando datos desde SharePoint..."):
-            df = _load_report_data()
-            st.session_state["report_df"] = df
+    if refresh:
+        invalidate_events_cache()
 
-    df = st.session_state.get("report_df", pd.DataFrame())
+    try:
+        df = _load_report_data()
+    except SharePointReadError as e:
+        st.error(str(e))
+        return
 
     if df.empty:
         st.info("📭 No hay eventos registrados. Captura un evento primero.")
@@ -402,35 +556,24 @@ def render() -> None:
         )
 
     with f_col3:
-        proyectos = ["Todos"] + sorted(df["numero_proyecto"].dropna().unique().tolist()) if "numero_proyecto" in df.columns else ["Todos"]
+        # Categories are already the sorted distinct values
+        proyectos = ["Todos", *df["numero_proyecto"].cat.categories] if "numero_proyecto" in df.columns else ["Todos"]
         selected_proyecto = st.selectbox("Proyecto", options=proyectos, key="rpt_proyecto")
 
     with f_col4:
-        statuses = ["Todos", "Open", "In Progress", "Closed"]
+        statuses = ["Todos", *STATUS_ORDER]
         selected_status = st.selectbox("Status", options=statuses, key="rpt_status")
 
     # Apply filters
-    filtered = df.copy()
-    # Strip timezone for date comparison (SharePoint returns UTC-aware datetimes)
-    if "fecha_hallazgo" in filtered.columns and hasattr(filtered["fecha_hallazgo"].dtype, "tz"):
-        filtered["fecha_hallazgo"] = filtered["fecha_hallazgo"].dt.tz_localize(None)
-    if fecha_inicio and "fecha_hallazgo" in filtered.columns:
-        filtered = filtered[filtered["fecha_hallazgo"] >= pd.Timestamp(fecha_inicio)]
-    if fecha_fin and "fecha_hallazgo" in filtered.columns:
-        filtered = filtered[filtered["fecha_hallazgo"] <= pd.Timestamp(fecha_fin) + pd.Timedelta(days=1)]
-    if selected_proyecto != "Todos" and "numero_proyecto" in filtered.columns:
-        filtered = filtered[filtered["numero_proyecto"] == selected_proyecto]
-    if selected_status != "Todos" and "status" in filtered.columns:
-        filtered = filtered[filtered["status"] == selected_status]
-
-    filtered = filtered.reset_index(drop=True)
+    filtered = _filter_report_df(df, fecha_inicio, fecha_fin, selected_proyecto, selected_status)
 
     # --- Export (uses filtered data) ---
     with col_export:
-        excel_bytes = _export_excel(filtered)
+        # Deferred: the workbook is built on a worker thread only when the
+        # button is clicked, not on every rerun of the report.
         st.download_button(
             label="📥 Exportar Excel",
-            data=excel_bytes,
+            data=lambda: _export_excel(filtered),
             file_name="reporte_eventos.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             key="export_excel",
@@ -442,21 +585,21 @@ def render() -> None:
 
     # --- Summary Metrics ---
     total = len(filtered)
-    open_count = len(filtered[filtered["status"] == "Open"]) if "status" in filtered.columns else 0
-    in_progress = len(filtered[filtered["status"] == "In Progress"]) if "status" in filtered.columns else 0
-    closed = len(filtered[filtered["status"] == "Closed"]) if "status" in filtered.columns else 0
-
-    # Avg close time (days) — for events that have both fecha_hallazgo and fecha_real_cierre
+    aggregates = _compute_chart_aggregates(filtered)
+    status_counts = aggregates["status"]
+    open_count = int(status_counts.get("Open", 0))
+    in_progress = int(status_counts.get("In Progress", 0))
+    closed = int(status_counts.get("Closed", 0))
+
+    # Avg close time (days) — for events that have both fecha_hallazgo and fecha_real_cierre.
+    # Skipped when nothing in the filter is closed (e.g. an Open / In Progress filter).
     avg_close_days = None
-    if "fecha_hallazgo" in filtered.columns and "fecha_real_cierre" in filtered.columns:
-        closed_events = filtered.dropna(subset=["fecha_hallazgo", "fecha_real_cierre"])
-        if not closed_events.empty:
-            cierre = pd.to_datetime(closed_events["fecha_real_cierre"], errors="coerce")
-            hallazgo = closed_events["fecha_hallazgo"]
-            deltas = (cierre - hallazgo).dt.days
-            deltas = deltas.dropna()
-            if len(deltas) > 0:
-                avg_close_days = round(deltas.mean(), 1)
+    if closed > 0 and "fecha_hallazgo" in filtered.columns and "fecha_real_cierre" in filtered.columns:
+        # One vectorized subtraction over the whole column; rows missing
+        # either date come out NaT and mean() skips them.
+        deltas = (filtered["fecha_real_cierre"] - filtered["fecha_hallazgo"]).dt.days
+        if deltas.notna().any():
+            avg_close_days = round(deltas.mean(), 1)
 
     # Close efficiency (%)
     close_efficiency = round(closed / total * 100, 1) if total > 0 else 0.0
@@ -475,18 +618,18 @@ def render() -> None:
     # Row 1: Pareto Impacto | Eventos por Proyecto
     chart_r1c1, chart_r1c2 = st.columns(2)
     with chart_r1c1:
-        _render_pareto(filtered, column="tipo_impacto", title="Pareto — Tipo de Impacto", bar_color="#D13438")
+        _render_pareto(aggregates["tipo_impacto"], title="Pareto — Tipo de Impacto", bar_color="#D13438")
     with chart_r1c2:
-        _render_events_by_project(filtered)
+        _render_events_by_project(aggregates["numero_proyecto"])
 
     # Row 2: Pareto Causas | Tendencia Mensual
     chart_r2c1, chart_r2c2 = st.columns(2)
     with chart_r2c1:
-        _render_pareto(filtered, column="causa", title="Pareto — Causas", bar_color="#0078D4")
+        _render_pareto(aggregates["causa"], title="Pareto — Causas", bar_color="#0078D4")
     with chart_r2c2:
-        _render_trend(filtered)
+        _render_trend(aggregates["mes_impacto"], aggregates["mes"])
 
     st.markdown("---")
 
     # --- Insights ---
-    _render_insights(filtered)
+    _render_insights(aggregates, total)
@@ -11,9 +11,13 @@ Referencia: specs/operation-events.md — RF-004, Milestone 5
 
 from __future__ import annotations
 
+import base64
+from functools import lru_cache
+
+import pandas as pd
 import streamlit as st
 
-from auth.microsoft import is_authenticated, get_current_user
+from auth.microsoft import is_authenticated, get_current_user, get_user_photo
 from components.navigation import render_page_header
 from config.catalogs import (
     get_catalog,
@@ -31,6 +35,34 @@ from config.theme import theme
 from utils.sharepoint import test_sharepoint_connection, get_list_columns, FIELD_MAP
 
 
+# SharePoint internal column names the app reads and writes
+EXPECTED_COLS = frozenset(FIELD_MAP.values())
+
+# Static HTML blocks; the theme is fixed for the life of the process, so
+# they are rendered once at import. Only the counts are filled per rerun.
+_CONNECTION_TIP_HTML = f"""
+    <div style="background:{theme.colors.surface}; border:1px solid {theme.colors.border};
+                border-radius:{theme.border_radius}; padding:1rem; margin-top:1rem;">
+        <p style="color:{theme.colors.text_muted}; font-size:0.85rem; margin:0;">
+            💡 <strong>Tip:</strong> Configura <code>SHAREPOINT_SITE_ID</code> y
+            <code>SHAREPOINT_LIST_ID</code> en tu archivo <code>.env</code>.
+            Consulta <code>.env.example</code> para instrucciones de cómo obtener estos valores.
+        </p>
+    </div>
+    """
+
+_SUMMARY_BAR_TPL = f"""
+    <div style="background:{theme.colors.surface}; border:1px solid {theme.colors.border};
+                border-radius:{theme.border_radius}; padding:0.75rem 1rem; margin-bottom:1rem;
+                text-align:center;">
+        <span style="color:{theme.colors.text_secondary}; font-size:0.9rem;">
+            <strong>{{n}}</strong> tipos de impacto &nbsp;|&nbsp;
+            <strong>{{total}}</strong> causas totales
+        </span>
+    </div>
+    """
+
+
 # ======================================================================
 # Tab 1: SharePoint Connection
 # ======================================================================
@@ -65,17 +97,15 @@ def _render_sharepoint_tab() -> None:
                 st.markdown("---")
                 st.subheader("Columnas de la Lista")
 
-                expected_cols = set(FIELD_MAP.values())
                 actual_col_names = {c["name"] for c in columns}
 
-                for col in columns:
-                    name = col["name"]
-                    display = col["displayName"]
-                    col_type = col["columnType"]
-                    is_mapped = "✅" if name in expected_cols else ""
-                    st.markdown(f"- **{display}** (`{name}`) — _{col_type}_ {is_mapped}")
+                st.markdown("\n".join(
+                    f"- **{c['displayName']}** (`{c['name']}`) — _{c['columnType']}_ "
+                    f"{'✅' if c['name'] in EXPECTED_COLS else ''}"
+                    for c in columns
+                ))
 
-                missing = expected_cols - actual_col_names
+                missing = EXPECTED_COLS - actual_col_names
                 if missing:
                     st.markdown("---")
                     st.warning(
@@ -89,19 +119,7 @@ def _render_sharepoint_tab() -> None:
         else:
             st.error(f"❌ {message}")
 
-    st.markdown(
-        f"""
-        <div style="background:{theme.colors.surface}; border:1px solid {theme.colors.border};
-                    border-radius:{theme.border_radius}; padding:1rem; margin-top:1rem;">
-            <p style="color:{theme.colors.text_muted}; font-size:0.85rem; margin:0;">
-                💡 <strong>Tip:</strong> Configura <code>SHAREPOINT_SITE_ID</code> y
-                <code>SHAREPOINT_LIST_ID</code> en tu archivo <code>.env</code>.
-                Consulta <code>.env.example</code> para instrucciones de cómo obtener estos valores.
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_CONNECTION_TIP_HTML, unsafe_allow_html=True)
 
 
 # ======================================================================
@@ -117,16 +135,7 @@ def _render_catalogs_tab() -> None:
 
     # Summary bar
     st.markdown(
-        f"""
-        <div style="background:{theme.colors.surface}; border:1px solid {theme.colors.border};
-                    border-radius:{theme.border_radius}; padding:0.75rem 1rem; margin-bottom:1rem;
-                    text-align:center;">
-            <span style="color:{theme.colors.text_secondary}; font-size:0.9rem;">
-                <strong>{len(catalog)}</strong> tipos de impacto &nbsp;|&nbsp;
-                <strong>{total_causes}</strong> causas totales
-            </span>
-        </div>
-        """,
+        _SUMMARY_BAR_TPL.format(n=len(catalog), total=total_causes),
         unsafe_allow_html=True,
     )
 
@@ -153,51 +162,60 @@ def _render_catalogs_tab() -> None:
 
     st.markdown("---")
 
-    # --- Impact types with causes ---
-    for impact_type in get_impact_types():
+    # --- Catalog listing (single read-only grid) ---
+    rows = [
+        (impact_type, cause)
+        for impact_type, causes in catalog.items()
+        for cause in (causes or (None,))
+    ]
+    st.dataframe(
+        pd.DataFrame(rows, columns=["Tipo de Impacto", "Causa"]),
+        width="stretch",
+        hide_index=True,
+    )
+
+    # --- Edit one impact type at a time ---
+    st.markdown("##### ✏️ Editar Tipo de Impacto")
+    impact_type = st.selectbox(
+        "Tipo de impacto",
+        options=get_impact_types(),
+        key="edit_impact_type",
+        index=None,
+        placeholder="Selecciona un tipo de impacto...",
+    )
+
+    if impact_type is not None:
         causes = get_causes_for_impact(impact_type)
 
-        with st.expander(f"**{impact_type}** ({len(causes)} causas)", expanded=False):
-            # --- Delete impact type ---
-            col_title, col_del = st.columns([4, 1])
-            with col_del:
-                if st.button("🗑️ Eliminar tipo", key=f"del_impact_{impact_type}"):
-                    if remove_impact_type(impact_type):
-                        st.success(f"Tipo **{impact_type}** eliminado.")
-                        st.rerun()
-
-            # --- List causes with delete ---
-            if causes:
-                for cause in causes:
-                    c_name, c_del = st.columns([5, 1])
-                    with c_name:
-                        st.markdown(f"• {cause}")
-                    with c_del:
-                        if st.button("✕", key=f"del_cause_{impact_type}_{cause}"):
-                            if remove_cause(impact_type, cause):
-                                st.rerun()
+        with st.form(key="form_edit_causes", clear_on_submit=True):
+            to_remove = st.multiselect(
+                f"Causas a eliminar de **{impact_type}**",
+                options=causes,
+                placeholder="Sin causas registradas." if not causes else "Selecciona causas...",
+            )
+            new_cause = st.text_input(
+                "Nueva causa",
+                placeholder="Nombre de la causa",
+            )
+            submitted = st.form_submit_button("💾 Guardar Cambios", type="primary")
+
+        if submitted:
+            new_cause = new_cause.strip()
+            if not to_remove and not new_cause:
+                st.warning("⚠️ No hay cambios que guardar.")
+            elif new_cause and new_cause in causes and new_cause not in to_remove:
+                st.warning("⚠️ Esa causa ya existe.")
             else:
-                st.caption("Sin causas registradas.")
-
-            # --- Add cause ---
-            st.markdown("")
-            ac1, ac2 = st.columns([3, 1])
-            with ac1:
-                new_cause = st.text_input(
-                    "Nueva causa",
-                    key=f"new_cause_{impact_type}",
-                    placeholder="Nombre de la causa",
-                    label_visibility="collapsed",
-                )
-            with ac2:
-                if st.button("➕ Causa", key=f"btn_add_cause_{impact_type}"):
-                    if new_cause and new_cause.strip():
-                        if add_cause(impact_type, new_cause.strip()):
-                            st.rerun()
-                        else:
-                            st.warning("⚠️ Esa causa ya existe.")
-                    else:
-                        st.warning("⚠️ Ingresa un nombre.")
+                for cause in to_remove:
+                    remove_cause(impact_type, cause)
+                if new_cause:
+                    add_cause(impact_type, new_cause)
+                st.rerun()
+
+        if st.button("🗑️ Eliminar tipo", key="btn_del_impact"):
+            if remove_impact_type(impact_type):
+                st.success(f"Tipo **{impact_type}** eliminado.")
+                st.rerun()
 
     # --- Reset to defaults ---
     st.markdown("---")
@@ -213,6 +231,35 @@ def _render_catalogs_tab() -> None:
 # Tab 3: User Profile
 # ======================================================================
 
+@lru_cache(maxsize=4)
+def _photo_avatar_html(photo: bytes, content_type: str, primary: str) -> str:
+    """Return the circular photo avatar HTML (memoized so the photo is encoded once)."""
+    b64 = base64.b64encode(photo).decode("ascii")
+    return f"""
+        <img src="data:{content_type};base64,{b64}" style="
+            width:80px; height:80px; border-radius:50%;
+            object-fit:cover; border:2px solid {primary};
+            display:block;
+        " />
+        """
+
+
+@lru_cache(maxsize=32)
+def _avatar_html(name: str, primary: str, primary_dark: str) -> str:
+    """Return the initials avatar HTML (memoized per user name and theme colors)."""
+    initials = "".join(w[0] for w in name.split()[:2]).upper()
+    return f"""
+        <div style="
+            width:80px; height:80px; border-radius:50%;
+            background:linear-gradient(135deg, {primary}, {primary_dark});
+            color:white; display:flex; align-items:center;
+            justify-content:center; font-size:1.5rem; font-weight:700;
+        ">
+            {initials}
+        </div>
+        """
+
+
 def _render_profile_tab() -> None:
     """Render user profile tab."""
     st.subheader("Usuario Actual")
@@ -222,33 +269,17 @@ def _render_profile_tab() -> None:
 
     col1, col2 = st.columns([1, 3])
     with col1:
-        photo = user.get("photo")
+        photo = get_user_photo(user)
         if photo:
             st.markdown(
-                f"""
-                <img src="{photo}" style="
-                    width:80px; height:80px; border-radius:50%;
-                    object-fit:cover; border:2px solid {theme.colors.primary};
-                    display:block;
-                " />
-                """,
+                _photo_avatar_html(
+                    photo, user.get("photo_content_type") or "image/jpeg", theme.colors.primary,
+                ),
                 unsafe_allow_html=True,
             )
         else:
-            initials = "".join(
-                [w[0] for w in user.get("name", "U").split()[:2]]
-            ).upper()
             st.markdown(
-                f"""
-                <div style="
-                    width:80px; height:80px; border-radius:50%;
-                    background:linear-gradient(135deg, {theme.colors.primary}, {theme.colors.primary_dark});
-                    color:white; display:flex; align-items:center;
-                    justify-content:center; font-size:1.5rem; font-weight:700;
-                ">
-                    {initials}
-                </div>
-                """,
+                _avatar_html(user.get("name", "U"), theme.colors.primary, theme.colors.primary_dark),
                 unsafe_allow_html=True,
             )
 
@@ -10,19 +10,24 @@ Requirements:
     - Admin consent granted
     - EMAIL_SENDER configured in .env
 
+Notifications are normally sent with enqueue_event_notification, which
+runs the Graph call on a small background pool so saving an event does not
+wait on the mail round-trip. send_event_notifications notifies several
+recipients of one event, building the message once and posting in parallel.
+
 Referencia: specs/operation-events.md — Milestone 2
 ============================================================================
 """
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from html import escape
 from typing import Any
 
-import msal
-import requests
-import streamlit as st
-
 from config.settings import get_settings
+from utils.http import dump_json, get_session
+from utils.sharepoint import _get_app_token
 
 
 # ======================================================================
@@ -31,63 +36,25 @@ from config.settings import get_settings
 
 GRAPH_SEND_MAIL = "https://graph.microsoft.com/v1.0/users/{sender}/sendMail"
 
-
-# ======================================================================
-# Authentication — reuse MSAL app from sharepoint module
-# ======================================================================
-
-@st.cache_resource(ttl=3000, show_spinner=False)
-def _get_msal_app() -> msal.ConfidentialClientApplication:
-    """Cached MSAL confidential client for app-level operations."""
-    s = get_settings()
-    return msal.ConfidentialClientApplication(
-        client_id=s.azure_client_id,
-        client_credential=s.azure_client_secret,
-        authority=s.azure_authority,
-    )
-
-
-def _get_app_token() -> str | None:
-    """Acquire an application-level access token."""
-    app = _get_msal_app()
-    result = app.acquire_token_for_client(
-        scopes=get_settings().graph_app_scopes,
-    )
-    if "access_token" in result:
-        return result["access_token"]
-    return None
+# Background senders shared by all sessions. sendMail is I/O-bound, so a
+# handful of threads lets multi-recipient fan-out proceed in parallel.
+_EMAIL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="email")
 
 
 # ======================================================================
 # Email Template
 # ======================================================================
 
-def _build_email_html(event_data: dict[str, Any]) -> str:
-    """Build a professional HTML email body with event details."""
-    settings = get_settings()
-    app_url = settings.app_url or "http://localhost:3001"
-
-    persona = event_data.get("persona_detecta", "N/A")
-    tipo_impacto = event_data.get("tipo_impacto", "N/A")
-    causa = event_data.get("causa", "N/A")
-    numero_proyecto = event_data.get("numero_proyecto", "N/A")
-    numero_parte = event_data.get("numero_parte", "N/A")
-    responsable = event_data.get("responsable", "N/A")
-    comentarios = event_data.get("comentarios", "—")
-    fecha = event_data.get("fecha_hallazgo", "N/A")
-    if hasattr(fecha, "strftime"):
-        fecha = fecha.strftime("%d/%m/%Y %H:%M")
-
-    # Color based on impact type
-    impact_colors = {
-        "Paro de Ensamble": "#D13438",
-        "Retrabajo": "#FF8C00",
-        "Mejora del Proceso": "#0078D4",
-        "Falta de Material": "#8764B8",
-    }
-    accent_color = impact_colors.get(tipo_impacto, "#0078D4")
+# Header / badge / button color per impact type
+_IMPACT_COLORS: dict[str, str] = {
+    "Paro de Ensamble": "#D13438",
+    "Retrabajo": "#FF8C00",
+    "Mejora del Proceso": "#0078D4",
+    "Falta de Material": "#8764B8",
+}
 
-    return f"""
+# Built once at import; _build_email_html only fills the placeholders.
+_EMAIL_TPL = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -155,7 +122,7 @@ def _build_email_html(event_data: dict[str, Any]) -> str:
                                     </tr>
                                     <tr style="background:#fafafa;">
                                         <td style="padding:10px 16px; font-size:13px; color:#666;">Comentarios</td>
-                                        <td style="padding:10px 16px; font-size:13px; color:#333;">{comentarios if comentarios else '—'}</td>
+                                        <td style="padding:10px 16px; font-size:13px; color:#333;">{comentarios}</td>
                                     </tr>
                                 </table>
                             </td>
@@ -188,48 +155,84 @@ def _build_email_html(event_data: dict[str, Any]) -> str:
     """
 
 
+def _build_email_html(event_data: dict[str, Any]) -> str:
+    """Build a professional HTML email body with event details."""
+    app_url = get_settings().app_url or "http://localhost:3001"
+
+    tipo_impacto = event_data.get("tipo_impacto", "N/A")
+    fecha = event_data.get("fecha_hallazgo", "N/A")
+    if hasattr(fecha, "strftime"):
+        fecha = fecha.strftime("%d/%m/%Y %H:%M")
+
+    fields = {
+        "persona": event_data.get("persona_detecta", "N/A"),
+        "tipo_impacto": tipo_impacto,
+        "causa": event_data.get("causa", "N/A"),
+        "numero_proyecto": event_data.get("numero_proyecto", "N/A"),
+        "numero_parte": event_data.get("numero_parte", "N/A"),
+        "responsable": event_data.get("responsable", "N/A"),
+        "comentarios": event_data.get("comentarios") or "—",
+        "fecha": fecha,
+    }
+
+    # User-entered values are escaped; the template itself is trusted
+    return _EMAIL_TPL.format(
+        accent_color=_IMPACT_COLORS.get(tipo_impacto, "#0078D4"),
+        app_url=escape(app_url),
+        **{key: escape(str(value)) for key, value in fields.items()},
+    )
+
+
 # ======================================================================
 # Send Email
 # ======================================================================
 
-def send_event_notification(
+def _prepare_notification(
     event_data: dict[str, Any],
-    recipient_email: str,
-    recipient_name: str = "",
-) -> tuple[bool, str]:
+) -> tuple[str, dict[str, str], dict[str, Any]] | str:
     """
-    Send an email notification to the event responsable.
-
-    Args:
-        event_data: Dict with event fields (persona_detecta, tipo_impacto, etc.)
-        recipient_email: Email address of the responsable.
-        recipient_name: Display name of the responsable.
-
-    Returns:
-        Tuple of (success: bool, message: str).
+    Resolve everything a notification needs except the recipient: the
+    sendMail URL, auth headers and the message (subject + HTML body).
+    Returns an error message string when sending is not possible.
     """
     settings = get_settings()
 
     if not settings.email_sender:
-        return False, "EMAIL_SENDER no está configurado en .env"
+        return "EMAIL_SENDER no está configurado en .env"
 
     token = _get_app_token()
     if not token:
-        return False, "No se pudo obtener token de acceso para enviar email."
+        return "No se pudo obtener token de acceso para enviar email."
 
     tipo_impacto = event_data.get("tipo_impacto", "Evento")
     numero_proyecto = event_data.get("numero_proyecto", "")
-    subject = f"[Operation Events] {tipo_impacto} — Proyecto {numero_proyecto}"
 
-    html_body = _build_email_html(event_data)
+    url = GRAPH_SEND_MAIL.format(sender=settings.email_sender)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+    message = {
+        "subject": f"[Operation Events] {tipo_impacto} — Proyecto {numero_proyecto}",
+        "body": {
+            "contentType": "HTML",
+            "content": _build_email_html(event_data),
+        },
+    }
+    return url, headers, message
+
 
+def _post_notification(
+    url: str,
+    headers: dict[str, str],
+    message: dict[str, Any],
+    recipient_email: str,
+    recipient_name: str = "",
+) -> tuple[bool, str]:
+    """POST one prepared message to a single recipient."""
     payload = {
         "message": {
-            "subject": subject,
-            "body": {
-                "contentType": "HTML",
-                "content": html_body,
-            },
+            **message,
             "toRecipients": [
                 {
                     "emailAddress": {
@@ -242,14 +245,8 @@ def send_event_notification(
         "saveToSentItems": "false",
     }
 
-    url = GRAPH_SEND_MAIL.format(sender=settings.email_sender)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
-
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=15)
+        resp = get_session().post(url, headers=headers, data=dump_json(payload), timeout=15)
         if resp.status_code == 202:
             return True, f"Email enviado a {recipient_email}"
         else:
@@ -257,3 +254,74 @@ def send_event_notification(
             return False, f"Error al enviar email: {error_msg}"
     except Exception as e:
         return False, f"Error de conexión al enviar email: {e}"
+
+
+def send_event_notification(
+    event_data: dict[str, Any],
+    recipient_email: str,
+    recipient_name: str = "",
+) -> tuple[bool, str]:
+    """
+    Send an email notification to the event responsable.
+
+    Args:
+        event_data: Dict with event fields (persona_detecta, tipo_impacto, etc.)
+        recipient_email: Email address of the responsable.
+        recipient_name: Display name of the responsable.
+
+    Returns:
+        Tuple of (success: bool, message: str).
+    """
+    prepared = _prepare_notification(event_data)
+    if isinstance(prepared, str):
+        return False, prepared
+    return _post_notification(*prepared, recipient_email, recipient_name)
+
+
+def send_event_notifications(
+    event_data: dict[str, Any],
+    recipients: list[tuple[str, str]],
+) -> list[tuple[bool, str]]:
+    """
+    Notify several recipients about the same event.
+
+    The token and HTML body are prepared once; the sendMail calls then run
+    concurrently on the shared email pool. Must not be called from an
+    email worker thread.
+
+    Args:
+        event_data: Dict with event fields (persona_detecta, tipo_impacto, etc.)
+        recipients: (email, display name) pairs.
+
+    Returns:
+        One (success, message) tuple per recipient, in the given order.
+    """
+    prepared = _prepare_notification(event_data)
+    if isinstance(prepared, str):
+        return [(False, prepared)] * len(recipients)
+
+    futures = [
+        _EMAIL_EXECUTOR.submit(_post_notification, *prepared, email, name)
+        for email, name in recipients
+    ]
+    return [future.result() for future in futures]
+
+
+def enqueue_event_notification(
+    event_data: dict[str, Any],
+    recipient_email: str,
+    recipient_name: str = "",
+) -> Future[tuple[bool, str]]:
+    """
+    Send the event notification on a background thread.
+
+    Returns:
+        Future resolving to the same (success, message) tuple as
+        send_event_notification.
+    """
+    return _EMAIL_EXECUTOR.submit(
+        send_event_notification,
+        event_data,
+        recipient_email,
+        recipient_name,
+    )
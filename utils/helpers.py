@@ -8,24 +8,30 @@ Utility functions used across the application.
 
 from __future__ import annotations
 
-import locale
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _number_spec(decimals: int) -> str:
+    """Format spec with thousands separators, built once per precision."""
+    return f",.{decimals}f"
 
 
 def format_number(value: int | float, decimals: int = 0) -> str:
     """Format a number with thousands separators. E.g. 1234567 → '1,234,567'."""
-    if decimals > 0:
-        return f"{value:,.{decimals}f}"
-    return f"{value:,.0f}"
+    if decimals <= 0:
+        return format(value, ",.0f")  # the common case skips the cache lookup
+    return format(value, _number_spec(decimals))
 
 
 def format_currency(value: float, symbol: str = "$", decimals: int = 2) -> str:
     """Format a number as currency. E.g. 1234.5 → '$1,234.50'."""
-    return f"{symbol}{value:,.{decimals}f}"
+    return symbol + format(value, _number_spec(decimals))
 
 
 def format_percentage(value: float, decimals: int = 1) -> str:
     """Format a decimal as percentage. E.g. 0.123 → '12.3%'."""
-    return f"{value * 100:,.{decimals}f}%"
+    return format(value * 100, _number_spec(decimals)) + "%"
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "…") -> str:
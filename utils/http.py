@@ -0,0 +1,98 @@
+"""
+============================================================================
+HTTP Session — Microsoft Graph
+============================================================================
+Shared ``requests.Session`` with a sized connection pool and retries.
+Reusing one session keeps TCP/TLS connections to graph.microsoft.com
+alive across calls instead of paying a new handshake on every request.
+Large Graph payloads are encoded and decoded with orjson when available.
+
+Usage:
+    from utils.http import GRAPH_TIMEOUT, dump_json, get_session, parse_json
+
+    resp = get_session().get(url, headers=headers, timeout=GRAPH_TIMEOUT)
+    data = parse_json(resp)
+============================================================================
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional — fall back to requests' stdlib json
+    orjson = None
+
+
+# ======================================================================
+# Pool Configuration
+# ======================================================================
+
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 50
+
+# (connect, read) — a dead peer is abandoned after ~3 s while slow
+# response bodies still get the full read budget.
+GRAPH_TIMEOUT: tuple[float, float] = (3.05, 15)
+
+# Only idempotent methods are retried (urllib3 default), so POST/PATCH
+# calls are never replayed automatically.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+def build_session(max_retries: Retry | int = RETRY_POLICY) -> requests.Session:
+    """
+    Create a session with a pooled HTTPS adapter.
+
+    Modules that implement their own retry loop pass ``max_retries=0`` so
+    requests are not retried twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=max_retries,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = build_session()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session."""
+    return _SESSION
+
+
+# ======================================================================
+# JSON Encoding / Decoding
+# ======================================================================
+
+def parse_json(resp: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def dump_json(obj: Any) -> bytes:
+    """
+    Encode a request body as UTF-8 JSON, using orjson when it is installed.
+    Pass the result as ``data=`` with a JSON Content-Type header.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
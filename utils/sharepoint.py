@@ -11,7 +11,7 @@ Requirements:
     - SHAREPOINT_SITE_ID and SHAREPOINT_LIST_ID set in .env
 
 Usage:
-    from utils.sharepoint import create_event, get_all_events, update_event
+    from utils.sharepoint import create_event, get_all_events, update_event, update_events_batch
 
     # Create a new event
     item_id = create_event({
@@ -21,24 +21,33 @@ Usage:
         ...
     })
 
-    # Read all events
+    # Read all events (get_all_events_cached shares one snapshot for 60 s)
     events = get_all_events()
 
     # Update an event
     update_event(item_id, {"Status": "Closed"})
+
+    # Update several events in as few round-trips as possible
+    update_events_batch({item_id: {"status": "Closed"}, other_id: {"status": "Open"}})
 ============================================================================
 """
 
 from __future__ import annotations
 
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Sequence
 
 import msal
+import pandas as pd
 import requests
 import streamlit as st
 
 from config.settings import get_settings
+from utils.http import build_session, dump_json, parse_json
 
 
 # ======================================================================
@@ -46,6 +55,21 @@ from config.settings import get_settings
 # ======================================================================
 
 GRAPH_BASE = "https://graph.microsoft.com/v1.0"
+GRAPH_BATCH_URL = f"{GRAPH_BASE}/$batch"
+
+# Pooled keep-alive session for all list calls. Adapter-level retries are
+# off because _request_with_retry owns the retry policy for this module.
+_session = build_session(max_retries=0)
+
+# Graph JSON batching accepts at most 20 sub-requests per $batch call
+GRAPH_BATCH_MAX_REQUESTS = 20
+
+# Seconds a fetched list snapshot is shared across reruns and sessions
+EVENTS_CACHE_TTL_S = 60
+
+# Upper bound on $batch calls in flight at once; stays well below the
+# shared session's pool size and SharePoint's throttling thresholds.
+MAX_CONCURRENT_BATCHES = 8
 
 
 def _get_list_items_url() -> str:
@@ -63,7 +87,7 @@ def _get_list_item_url(item_id: str) -> str:
 # Authentication — Client Credentials
 # ======================================================================
 
-@st.cache_resource(ttl=3000, show_spinner=False)
+@st.cache_resource(show_spinner=False)
 def _get_msal_app() -> msal.ConfidentialClientApplication:
     """Cached MSAL confidential client for app-level operations."""
     s = get_settings()
@@ -74,18 +98,35 @@ def _get_msal_app() -> msal.ConfidentialClientApplication:
     )
 
 
+# (access_token, expires_at epoch seconds) for the app-level token, shared
+# by every session and worker thread in the process
+_token_cache: tuple[str, float] | None = None
+_token_lock = threading.Lock()
+
+# Refresh this many seconds before the token actually expires
+TOKEN_REFRESH_MARGIN_S = 60
+
+
 def _get_app_token() -> str | None:
     """
     Acquire an application-level access token using client credentials.
-    Returns the access token string, or None on failure.
+    The token is reused until shortly before it expires, so list and mail
+    calls skip the MSAL cache lookup. Returns None on failure.
     """
-    app = _get_msal_app()
-    result = app.acquire_token_for_client(
-        scopes=get_settings().graph_app_scopes,
-    )
-    if "access_token" in result:
-        return result["access_token"]
-    return None
+    global _token_cache
+    with _token_lock:
+        if _token_cache and _token_cache[1] - time.time() > TOKEN_REFRESH_MARGIN_S:
+            return _token_cache[0]
+
+        app = _get_msal_app()
+        result = app.acquire_token_for_client(
+            scopes=get_settings().graph_app_scopes,
+        )
+        if "access_token" not in result:
+            return None
+
+        _token_cache = (result["access_token"], time.time() + int(result.get("expires_in", 0)))
+        return _token_cache[0]
 
 
 def _get_headers() -> dict[str, str] | None:
@@ -99,6 +140,58 @@ def _get_headers() -> dict[str, str] | None:
     }
 
 
+# ======================================================================
+# Retry — Exponential Backoff with Jitter
+# ======================================================================
+# Transient throttling (429) and gateway errors are retried. Create
+# requests are only retried on 429/503, where SharePoint guarantees the
+# request was not processed, so a retry can never duplicate an event.
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_STATUSES_NON_IDEMPOTENT = frozenset({429, 503})
+RETRY_MAX_ATTEMPTS = 5
+RETRY_MIN_BACKOFF_S = 0.5
+RETRY_MAX_BACKOFF_S = 30.0
+RETRY_JITTER_S = 0.5
+
+
+def _retry_delay(resp: requests.Response, attempt: int) -> float:
+    """Seconds to wait before the next attempt, honoring ``Retry-After``."""
+    return _backoff_delay(resp.headers.get("Retry-After", ""), attempt)
+
+
+def _backoff_delay(retry_after: str, attempt: int) -> float:
+    """
+    Backoff for attempt ``attempt``; a numeric ``Retry-After`` value (also
+    found on $batch sub-responses) takes precedence.
+    """
+    if retry_after.isdigit():
+        return min(RETRY_MAX_BACKOFF_S, float(retry_after))
+    backoff = RETRY_MIN_BACKOFF_S * 2 ** attempt + random.uniform(0, RETRY_JITTER_S)
+    return min(RETRY_MAX_BACKOFF_S, backoff)
+
+
+def _request_with_retry(
+    method: str,
+    url: str,
+    *,
+    retry_statuses: frozenset[int] = RETRY_STATUSES,
+    send: Callable[..., requests.Response] = _session.request,
+    **kwargs: Any,
+) -> requests.Response:
+    """
+    Issue an HTTP request, retrying transient failures with exponential
+    backoff. The last response is returned as-is so callers keep their
+    existing error handling.
+    """
+    for attempt in range(RETRY_MAX_ATTEMPTS):
+        resp = send(method, url, **kwargs)
+        if resp.status_code not in retry_statuses or attempt == RETRY_MAX_ATTEMPTS - 1:
+            return resp
+        time.sleep(_retry_delay(resp, attempt))
+    return resp
+
+
 # ======================================================================
 # Field Mapping: Python dict keys → SharePoint column internal names
 # ======================================================================
@@ -121,29 +214,41 @@ FIELD_MAP = {
     "status":            "Status",           # Status
 }
 
+# SharePoint column name → Python-style key, for reading items back
+_REVERSE_FIELD_MAP: dict[str, str] = {v: k for k, v in FIELD_MAP.items()}
+
+# Columns fetched by default — only what the app maps, so wide lists with
+# extra text columns don't inflate every page
+_DEFAULT_SELECT: tuple[str, ...] = tuple(FIELD_MAP.values())
+
 
-def _to_sharepoint_fields(data: dict[str, Any]) -> dict[str, Any]:
-    """Convert Python-style keys to SharePoint column names."""
+def _to_sharepoint_fields(data: dict[str, Any], keep_none: bool = False) -> dict[str, Any]:
+    """
+    Convert Python-style keys to SharePoint column names.
+
+    None values are dropped unless ``keep_none`` is set, in which case they
+    are sent as null so an update clears the column.
+    """
+    # Walk only the keys being written; updates usually touch a few fields
     fields: dict[str, Any] = {}
-    for py_key, sp_key in FIELD_MAP.items():
-        if py_key in data:
-            val = data[py_key]
-            # Convert datetime to ISO string for SharePoint
-            if isinstance(val, datetime):
-                val = val.isoformat()
-            if val is not None:
-                fields[sp_key] = val
+    for py_key, val in data.items():
+        sp_key = FIELD_MAP.get(py_key)
+        if sp_key is None or (val is None and not keep_none):
+            continue
+        # Convert datetime to ISO string for SharePoint
+        if isinstance(val, datetime):
+            val = val.isoformat()
+        fields[sp_key] = val
     return fields
 
 
 def _from_sharepoint_fields(item: dict[str, Any]) -> dict[str, Any]:
     """Convert a SharePoint list item to a Python dict with friendly keys."""
-    fields = item.get("fields", {})
     result: dict[str, Any] = {"id": item.get("id", "")}
-    reverse_map = {v: k for k, v in FIELD_MAP.items()}
-    for sp_key, value in fields.items():
-        py_key = reverse_map.get(sp_key, sp_key)
-        result[py_key] = value
+    result.update(
+        (_REVERSE_FIELD_MAP.get(sp_key, sp_key), value)
+        for sp_key, value in item.get("fields", {}).items()
+    )
     return result
 
 
@@ -170,14 +275,17 @@ def create_event(data: dict[str, Any]) -> str | None:
     payload = {"fields": sp_fields}
 
     try:
-        resp = requests.post(
+        resp = _request_with_retry(
+            "POST",
             _get_list_items_url(),
+            retry_statuses=RETRY_STATUSES_NON_IDEMPOTENT,
             headers=headers,
-            json=payload,
+            data=dump_json(payload),
             timeout=15,
         )
         if resp.ok:
-            return resp.json().get("id")
+            invalidate_events_cache()
+            return parse_json(resp).get("id")
         else:
             error_msg = resp.json().get("error", {}).get("message", resp.text)
             st.error(f"Error al crear evento en SharePoint: {error_msg}")
@@ -187,24 +295,80 @@ def create_event(data: dict[str, Any]) -> str | None:
         return None
 
 
+def _build_fields_filter(filters: dict[str, str]) -> str:
+    """
+    Build an OData ``$filter`` on list fields from Python-style keys,
+    e.g. ``{"status": "Open"}`` → ``fields/Status eq 'Open'``.
+    """
+    clauses = []
+    for py_key, value in filters.items():
+        sp_key = FIELD_MAP.get(py_key, py_key)
+        escaped = str(value).replace("'", "''")
+        clauses.append(f"fields/{sp_key} eq '{escaped}'")
+    return " and ".join(clauses)
+
+
+class SharePointReadError(RuntimeError):
+    """Reading the list failed; the message is ready to show to the user."""
+
+
 def get_all_events(
-    select_fields: list[str] | None = None,
+    select_fields: Sequence[str] | None = _DEFAULT_SELECT,
     expand: bool = True,
-) -> list[dict[str, Any]]:
+    filters: dict[str, str] | None = None,
+    top: int = 999,
+    as_dataframe: bool = False,
+    raise_errors: bool = False,
+) -> list[dict[str, Any]] | pd.DataFrame:
     """
     Fetch all events from the Microsoft List.
 
     Args:
-        select_fields: Optional list of SharePoint column names to select.
+        select_fields: SharePoint column names to select; defaults to the
+            FIELD_MAP columns. Pass None to fetch every column.
         expand: Whether to expand fields (default True).
+        filters: Optional Python-style key → value equality filters,
+            evaluated server-side so only matching items are downloaded.
+        top: Page size requested from Graph; pages are followed via
+            ``@odata.nextLink``.
+        as_dataframe: Return a DataFrame built column-wise from the raw
+            items, with date columns parsed, instead of a list of dicts.
+        raise_errors: Raise SharePointReadError on failure instead of
+            showing st.error and returning the items read so far.
 
     Returns:
-        List of event dicts with Python-style keys.
+        List of event dicts with Python-style keys, or a DataFrame with
+        the same columns when ``as_dataframe`` is set.
+    """
+    raw_items: list[dict[str, Any]] = []
+    try:
+        _fetch_event_items(raw_items, select_fields, expand, filters, top)
+    except SharePointReadError as e:
+        if raise_errors:
+            raise
+        st.error(str(e))
+
+    if as_dataframe:
+        return _events_dataframe(raw_items)
+    return [_from_sharepoint_fields(item) for item in raw_items]
+
+
+def _fetch_event_items(
+    raw_items: list[dict[str, Any]],
+    select_fields: Sequence[str] | None,
+    expand: bool,
+    filters: dict[str, str] | None,
+    top: int,
+) -> None:
+    """
+    Page through the list, appending raw Graph items to ``raw_items`` so a
+    caller keeps what was read before a failure. Raises SharePointReadError.
     """
     headers = _get_headers()
     if not headers:
-        st.error("No se pudo obtener token de acceso. Verifica la configuración de Azure AD.")
-        return []
+        raise SharePointReadError(
+            "No se pudo obtener token de acceso. Verifica la configuración de Azure AD."
+        )
 
     params: dict[str, str] = {}
     if expand:
@@ -213,31 +377,87 @@ def get_all_events(
             params["$expand"] = f"fields($select={fields_str})"
         else:
             params["$expand"] = "fields"
-    params["$top"] = "999"
-
-    all_items: list[dict[str, Any]] = []
+    if filters:
+        params["$filter"] = _build_fields_filter(filters)
+        # Filtering on non-indexed list columns is rejected without this
+        headers = {**headers, "Prefer": "HonorNonIndexedQueriesWarningMayFailRandomly"}
+    params["$top"] = str(top)
 
     try:
         url: str | None = _get_list_items_url()
         while url:
-            resp = requests.get(url, headers=headers, params=params, timeout=15)
+            resp = _request_with_retry("GET", url, headers=headers, params=params, timeout=15)
             if not resp.ok:
                 error_msg = resp.json().get("error", {}).get("message", resp.text)
-                st.error(f"Error al leer eventos de SharePoint: {error_msg}")
-                return all_items
+                raise SharePointReadError(f"Error al leer eventos de SharePoint: {error_msg}")
 
-            data = resp.json()
-            items = data.get("value", [])
-            all_items.extend([_from_sharepoint_fields(item) for item in items])
+            data = parse_json(resp)
+            raw_items.extend(data.get("value", []))
 
             # Pagination
             url = data.get("@odata.nextLink")
             params = {}  # nextLink already contains params
 
+    except SharePointReadError:
+        raise
     except Exception as e:
-        st.error(f"Error de conexión con SharePoint: {e}")
+        raise SharePointReadError(f"Error de conexión con SharePoint: {e}") from e
 
-    return all_items
+
+# Date columns parsed when events are returned as a DataFrame
+_DATE_FIELDS = ("fecha_hallazgo", "fecha_plan", "fecha_real_cierre")
+
+
+def _events_dataframe(items: list[dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build the events DataFrame straight from raw Graph items: one frame
+    from the ``fields`` dicts, one vectorized column rename, and one
+    to_datetime per date column (ISO-8601, UTC).
+    """
+    df = pd.DataFrame([item.get("fields", {}) for item in items])
+    df = df.rename(columns=_REVERSE_FIELD_MAP)
+    df["id"] = [item.get("id", "") for item in items]
+    for col in _DATE_FIELDS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format="ISO8601", utc=True, errors="coerce")
+    return df
+
+
+@st.cache_data(ttl=EVENTS_CACHE_TTL_S, show_spinner=False)
+def get_all_events_cached(
+    filters: tuple[tuple[str, str], ...] = (),
+    as_dataframe: bool = False,
+) -> list[dict[str, Any]] | pd.DataFrame:
+    """
+    Cached wrapper — every session shares one fetched snapshot per filter
+    and return shape for EVENTS_CACHE_TTL_S seconds. Writes through this
+    module and the pages' refresh buttons drop it through
+    ``invalidate_events_cache()``.
+
+    Raises SharePointReadError instead of returning a partial result, so a
+    failed read is never cached; callers show the error themselves.
+    """
+    return get_all_events(
+        filters=dict(filters) or None, as_dataframe=as_dataframe, raise_errors=True,
+    )
+
+
+# Caches built on top of the event list elsewhere (e.g. the reports
+# page's prepared frame) register here so writes invalidate them too
+_EVENTS_CHANGED_HOOKS: list[Callable[[], None]] = []
+
+
+def on_events_changed(hook: Callable[[], None]) -> Callable[[], None]:
+    """Register ``hook`` to run whenever the event caches are invalidated."""
+    _EVENTS_CHANGED_HOOKS.append(hook)
+    return hook
+
+
+def invalidate_events_cache() -> None:
+    """Drop every cached copy of the event list after a write or refresh."""
+    get_all_events_cached.clear()
+    for hook in _EVENTS_CHANGED_HOOKS:
+        hook()
 
 
 def update_event(item_id: str, data: dict[str, Any]) -> bool:
@@ -256,17 +476,19 @@ def update_event(item_id: str, data: dict[str, Any]) -> bool:
         st.error("No se pudo obtener token de acceso. Verifica la configuración de Azure AD.")
         return False
 
-    sp_fields = _to_sharepoint_fields(data)
+    sp_fields = _to_sharepoint_fields(data, keep_none=True)
     url = f"{_get_list_item_url(item_id)}/fields"
 
     try:
-        resp = requests.patch(
+        resp = _request_with_retry(
+            "PATCH",
             url,
             headers=headers,
-            json=sp_fields,
+            data=dump_json(sp_fields),
             timeout=15,
         )
         if resp.ok:
+            invalidate_events_cache()
             return True
         else:
             error_msg = resp.json().get("error", {}).get("message", resp.text)
@@ -277,63 +499,202 @@ def update_event(item_id: str, data: dict[str, Any]) -> bool:
         return False
 
 
+def _post_update_batch(
+    headers: dict[str, str],
+    items_path: str,
+    chunk: list[str],
+    changes_by_id: dict[str, dict[str, Any]],
+) -> tuple[list[str], list[str]]:
+    """
+    Send one Graph $batch call for up to 20 item updates. Sub-requests
+    that come back throttled or with a transient 5xx are resent in a new
+    batch, up to RETRY_MAX_ATTEMPTS, before being reported as failed.
+
+    Runs on worker threads, so it reports problems through its return
+    value instead of calling Streamlit.
+
+    Returns:
+        Tuple of (updated item IDs, failure messages).
+    """
+    updated: list[str] = []
+    failures: list[str] = []
+    pending = list(chunk)
+
+    # Graph answers 200 for the $batch itself even when sub-requests were
+    # throttled, so throttled / transient items are resent on their own
+    for attempt in range(RETRY_MAX_ATTEMPTS):
+        payload = {
+            "requests": [
+                {
+                    "id": str(idx),
+                    "method": "PATCH",
+                    "url": f"{items_path}/{item_id}/fields",
+                    "headers": {"Content-Type": "application/json"},
+                    "body": _to_sharepoint_fields(changes_by_id[item_id], keep_none=True),
+                }
+                for idx, item_id in enumerate(pending)
+            ],
+        }
+
+        try:
+            resp = _request_with_retry(
+                "POST",
+                GRAPH_BATCH_URL,
+                headers=headers,
+                data=dump_json(payload),
+                timeout=30,
+            )
+        except Exception as e:
+            return updated, [*failures, f"Error de conexión con SharePoint: {e}"]
+
+        if not resp.ok:
+            error_msg = resp.json().get("error", {}).get("message", resp.text)
+            return updated, [*failures, error_msg]
+
+        last_attempt = attempt == RETRY_MAX_ATTEMPTS - 1
+        retry_ids: list[str] = []
+        delay = 0.0
+        for sub in parse_json(resp).get("responses", []):
+            item_id = pending[int(sub.get("id", 0))]
+            status = sub.get("status", 0)
+            if 200 <= status < 300:
+                updated.append(item_id)
+            elif status in RETRY_STATUSES and not last_attempt:
+                retry_ids.append(item_id)
+                sub_headers = {k.lower(): v for k, v in (sub.get("headers") or {}).items()}
+                delay = max(delay, _backoff_delay(str(sub_headers.get("retry-after", "")), attempt))
+            else:
+                error_msg = (sub.get("body") or {}).get("error", {}).get("message", "")
+                failures.append(f"{item_id}: {error_msg or status}")
+
+        if not retry_ids:
+            break
+        pending = retry_ids
+        time.sleep(delay)
+
+    return updated, failures
+
+
+def update_events_batch(changes_by_id: dict[str, dict[str, Any]]) -> list[str]:
+    """
+    Update several events with Graph JSON $batch requests (20 per call)
+    instead of one PATCH round-trip per item. When more than one batch is
+    needed, the batches are sent concurrently over the shared session.
+
+    Args:
+        changes_by_id: Mapping of SharePoint item ID → dict with
+            Python-style keys for the fields to update.
+
+    Returns:
+        IDs of the items that were updated successfully.
+    """
+    if not changes_by_id:
+        return []
+
+    headers = _get_headers()
+    if not headers:
+        st.error("No se pudo obtener token de acceso. Verifica la configuración de Azure AD.")
+        return []
+
+    s = get_settings()
+    items_path = f"/sites/{s.sharepoint_site_id}/lists/{s.sharepoint_list_id}/items"
+    item_ids = list(changes_by_id)
+    chunks = [
+        item_ids[start:start + GRAPH_BATCH_MAX_REQUESTS]
+        for start in range(0, len(item_ids), GRAPH_BATCH_MAX_REQUESTS)
+    ]
+
+    updated: list[str] = []
+    failures: list[str] = []
+    workers = min(MAX_CONCURRENT_BATCHES, len(chunks))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_post_update_batch, headers, items_path, chunk, changes_by_id)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            ok_ids, errors = future.result()
+            updated.extend(ok_ids)
+            failures.extend(errors)
+
+    if updated:
+        invalidate_events_cache()
+    if failures:
+        st.error("Error al actualizar eventos en SharePoint: " + "; ".join(failures))
+
+    return updated
+
+
 def get_list_columns() -> tuple[bool, list[dict[str, str]], str]:
     """
-    Fetch column definitions from the Microsoft List.
+    Fetch column definitions from the Microsoft List. Successful lookups
+    are cached for a minute, since the schema rarely changes and the
+    settings page asks on every connection test; failures are not, so a
+    fixed configuration shows up on the next try.
 
     Returns:
         Tuple of (success, columns_list, error_message).
         Each column dict has keys: name, displayName, type.
     """
+    try:
+        return True, _fetch_list_columns(), ""
+    except SharePointReadError as e:
+        return False, [], str(e)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_list_columns() -> list[dict[str, str]]:
+    """Cached column lookup; raises SharePointReadError so failures aren't stored."""
     headers = _get_headers()
     if not headers:
-        return False, [], "No se pudo obtener token de acceso."
+        raise SharePointReadError("No se pudo obtener token de acceso.")
 
     s = get_settings()
     if not s.sharepoint_site_id or not s.sharepoint_list_id:
-        return False, [], "SHAREPOINT_SITE_ID o SHAREPOINT_LIST_ID no configurados."
+        raise SharePointReadError("SHAREPOINT_SITE_ID o SHAREPOINT_LIST_ID no configurados.")
 
     url = f"{GRAPH_BASE}/sites/{s.sharepoint_site_id}/lists/{s.sharepoint_list_id}/columns"
 
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.ok:
-            raw_columns = resp.json().get("value", [])
-            columns = [
-                {
-                    "name": col.get("name", ""),
-                    "displayName": col.get("displayName", ""),
-                    "type": col.get("text", col.get("dateTime", col.get("choice", col.get("number", {})))),
-                    "description": col.get("description", ""),
-                    "columnType": _resolve_column_type(col),
-                }
-                for col in raw_columns
-                if not col.get("hidden", False) and not col.get("readOnly", False)
-            ]
-            return True, columns, ""
-        else:
-            error_msg = resp.json().get("error", {}).get("message", resp.text)
-            return False, [], f"Error: {error_msg}"
+        resp = _session.get(url, headers=headers, timeout=10)
     except Exception as e:
-        return False, [], f"Error de conexión: {e}"
+        raise SharePointReadError(f"Error de conexión: {e}") from e
+
+    if not resp.ok:
+        error_msg = resp.json().get("error", {}).get("message", resp.text)
+        raise SharePointReadError(f"Error: {error_msg}")
+
+    raw_columns = parse_json(resp).get("value", [])
+    return [
+        {
+            "name": col.get("name", ""),
+            "displayName": col.get("displayName", ""),
+            "type": col.get("text", col.get("dateTime", col.get("choice", col.get("number", {})))),
+            "description": col.get("description", ""),
+            "columnType": _resolve_column_type(col),
+        }
+        for col in raw_columns
+        if not col.get("hidden", False) and not col.get("readOnly", False)
+    ]
+
+
+# Graph column facet → display label, checked in priority order
+_COL_TYPE_PRIORITY: tuple[tuple[str, str], ...] = (
+    ("text", "Text"),
+    ("dateTime", "DateTime"),
+    ("choice", "Choice"),
+    ("number", "Number"),
+    ("boolean", "Boolean"),
+    ("personOrGroup", "Person"),
+    ("lookup", "Lookup"),
+)
 
 
 def _resolve_column_type(col: dict) -> str:
     """Resolve the column type from Graph API column definition."""
-    if "text" in col:
-        return "Text"
-    if "dateTime" in col:
-        return "DateTime"
-    if "choice" in col:
-        return "Choice"
-    if "number" in col:
-        return "Number"
-    if "boolean" in col:
-        return "Boolean"
-    if "personOrGroup" in col:
-        return "Person"
-    if "lookup" in col:
-        return "Lookup"
+    for facet, label in _COL_TYPE_PRIORITY:
+        if facet in col:
+            return label
     return col.get("type", "Unknown")
 
 
@@ -355,9 +716,9 @@ def test_sharepoint_connection() -> tuple[bool, str]:
     url = f"{GRAPH_BASE}/sites/{s.sharepoint_site_id}/lists/{s.sharepoint_list_id}"
 
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = _session.get(url, headers=headers, timeout=10)
         if resp.ok:
-            list_name = resp.json().get("displayName", "Unknown")
+            list_name = parse_json(resp).get("displayName", "Unknown")
             return True, f"Conexión exitosa. Lista: '{list_name}'"
         else:
             error_msg = resp.json().get("error", {}).get("message", resp.text)